@@ -0,0 +1,59 @@
+"""add partial unique index on active payment methods.
+
+An active payment method is identified by its name and card digits
+within a household. Enforcing that with a unique index over active rows
+lets creation insert directly instead of checking for a duplicate first,
+and closes the race between that check and the insert. ``NULLS NOT
+DISTINCT`` (PostgreSQL 15+) keeps two digitless methods with the same
+name colliding, as the old check did.
+
+The build fails if duplicate active rows already exist — deactivate or
+rename them first. A failed concurrent build leaves an INVALID index
+behind, so the upgrade drops any existing copy before building it again.
+
+Revision ID: 0004_payment_methods_unique
+Revises: 0002_activity_and_comments
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0004_payment_methods_unique"
+down_revision: str | Sequence[str] | None = "0002_activity_and_comments"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the active payment method unique index without locking writes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_payment_methods_household_name_digits_active",
+            table_name="payment_methods",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "uq_payment_methods_household_name_digits_active",
+            "payment_methods",
+            ["household_id", "name", "last_4_digits"],
+            unique=True,
+            postgresql_where=sa.text("active"),
+            postgresql_nulls_not_distinct=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the active payment method unique index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_payment_methods_household_name_digits_active",
+            table_name="payment_methods",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,50 @@
+"""add composite index for listing a household's payment methods.
+
+The payment method list filters on ``household_id`` (and usually
+``active``) and orders by ``created_at DESC``. Until now only active rows
+were indexed by household, so listing with deactivated methods included
+scanned the whole table. With ``created_at`` last, the planner can also
+read rows newest-first by scanning the index backwards instead of
+sorting.
+
+Revision ID: 0005_payment_methods_list
+Revises: 0004_payment_methods_unique
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0005_payment_methods_list"
+down_revision: str | Sequence[str] | None = "0004_payment_methods_unique"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create ix_payment_methods_household_active_created without locking writes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_payment_methods_household_active_created",
+            table_name="payment_methods",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_payment_methods_household_active_created",
+            "payment_methods",
+            ["household_id", "active", "created_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop ix_payment_methods_household_active_created."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_payment_methods_household_active_created",
+            table_name="payment_methods",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -138,7 +138,7 @@ def resolve_entity_cycle_id(  # noqa: C901 - one branch per entity type
     raise InvalidEntityReferenceExceptionError(entity_type.value, str(entity_id))
 
 
-async def get_comment_by_id(
+def get_comment_by_id(
     comment_id: Annotated[uuid.UUID, Path()],
     current_household: CurrentActiveHousehold,
     db: Annotated[Session, Depends(get_db)],
@@ -12,10 +12,12 @@ They live together so the polymorphic entity-type machinery is shared.
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.auth.models import User
@@ -37,17 +39,33 @@ comments_router = APIRouter(prefix="/comments", tags=["comments"])
 DatabaseDep = Annotated[Session, Depends(get_db)]
 
 
-def _serialize_actor(db: Session, user_id: uuid.UUID) -> schemas.ActorSummary:
-    """Build an ``ActorSummary`` for the given user id."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+def _actor_summaries(
+    db: Session, user_ids: Iterable[uuid.UUID]
+) -> dict[uuid.UUID, schemas.ActorSummary]:
+    """Look up the ``ActorSummary`` for every distinct user id in one query."""
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    rows = db.execute(select(User.id, User.username).where(User.id.in_(ids)))
+    return {
+        user_id: schemas.ActorSummary(id=user_id, username=username)
+        for user_id, username in rows
+    }
+
+
+def _actor_for(
+    actors: dict[uuid.UUID, schemas.ActorSummary], user_id: uuid.UUID
+) -> schemas.ActorSummary:
+    """Return the looked-up actor, or a placeholder if the user is gone."""
+    actor = actors.get(user_id)
+    if actor is None:
         # Soft-deleted users keep their activity but lose their username.
         return schemas.ActorSummary(id=user_id, username="(unknown)")
-    return schemas.ActorSummary(id=user.id, username=user.username)
+    return actor
 
 
 def _activity_to_response(
-    db: Session, entry: models.ActivityLog
+    entry: models.ActivityLog, actors: dict[uuid.UUID, schemas.ActorSummary]
 ) -> schemas.ActivityResponse:
     """Hydrate an :class:`ActivityLog` row into its response schema."""
     return schemas.ActivityResponse(
@@ -55,7 +73,7 @@ def _activity_to_response(
         entity_type=EntityType(entry.entity_type),
         entity_id=entry.entity_id,
         cycle_id=entry.cycle_id,
-        actor=_serialize_actor(db, entry.actor_user_id),
+        actor=_actor_for(actors, entry.actor_user_id),
         action=ActivityAction(entry.action),
         changes=entry.changes,
         created_at=entry.created_at,
@@ -63,7 +81,7 @@ def _activity_to_response(
 
 
 def _comment_to_response(
-    db: Session, comment: models.Comment
+    comment: models.Comment, actors: dict[uuid.UUID, schemas.ActorSummary]
 ) -> schemas.CommentResponse:
     """Hydrate a :class:`Comment` row into its response schema."""
     return schemas.CommentResponse(
@@ -71,7 +89,7 @@ def _comment_to_response(
         entity_type=EntityType(comment.entity_type),
         entity_id=comment.entity_id,
         cycle_id=comment.cycle_id,
-        author=_serialize_actor(db, comment.author_user_id),
+        author=_actor_for(actors, comment.author_user_id),
         body=comment.body,
         edited_at=comment.edited_at,
         created_at=comment.created_at,
@@ -142,7 +160,8 @@ async def list_activity(
         # No scope provided → empty result rather than household-wide dump
         # (avoid accidentally leaking the full activity log).
         entries = []
-    return [_activity_to_response(db, entry) for entry in entries]
+    actors = _actor_summaries(db, (entry.actor_user_id for entry in entries))
+    return [_activity_to_response(entry, actors) for entry in entries]
 
 
 @comments_router.get(
@@ -193,7 +212,8 @@ async def list_comments(
         )
     else:
         comments = []
-    return [_comment_to_response(db, comment) for comment in comments]
+    actors = _actor_summaries(db, (comment.author_user_id for comment in comments))
+    return [_comment_to_response(comment, actors) for comment in comments]
 
 
 @comments_router.post(
@@ -221,7 +241,8 @@ async def create_comment(
         actor=current_user,
         cycle_id=cycle_id,
     )
-    return _comment_to_response(db, comment)
+    actors = _actor_summaries(db, [comment.author_user_id])
+    return _comment_to_response(comment, actors)
 
 
 @comments_router.patch(
@@ -239,7 +260,8 @@ async def update_comment(
     updated = service.comment_service.update(
         db, comment=comment, body=payload.body, actor=current_user
     )
-    return _comment_to_response(db, updated)
+    actors = _actor_summaries(db, [updated.author_user_id])
+    return _comment_to_response(updated, actors)
 
 
 @comments_router.delete(
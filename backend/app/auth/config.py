@@ -1,5 +1,5 @@
 # Remove this file or keep it as an alias
-from app.config import settings
+from app.config import get_settings
 
 # Alias for backward compatibility
-auth_settings = settings.AUTH
+auth_settings = get_settings().AUTH
@@ -26,6 +26,18 @@ class ErrorCode:
 JWT_TOKEN_PREFIX = "Bearer"
 JWT_SUBJECT = "access"
 
+# Challenge sent with every 401; shared rather than rebuilt on each raise
+# (response construction only reads it).
+WWW_AUTHENTICATE_HEADERS = {"WWW-Authenticate": JWT_TOKEN_PREFIX}
+
+# User profiles (/me and the admin user detail) are revalidated on every use
+# (no-cache) and never stored by shared caches (private); a matching
+# If-None-Match is answered with an empty 304.
+USER_CACHE_CONTROL = "private, no-cache"
+
+# Postgres NOTIFY channel announcing users whose cached snapshot is stale
+USER_CACHE_CHANNEL = "auth_user_changed"
+
 # Password validation
 MIN_PASSWORD_LENGTH = 8
 MAX_PASSWORD_LENGTH = 128
@@ -1,5 +1,9 @@
+import hashlib
+import threading
+import time
 from typing import Annotated
 
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
@@ -7,6 +11,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 
 from . import models, service, utils
+from .config import auth_settings
+from .constants import WWW_AUTHENTICATE_HEADERS
 from .exceptions import (
     InvalidTokenExceptionError,
 )
@@ -17,19 +23,71 @@ oauth2_scheme = OAuth2PasswordBearer(
     scheme_name="Bearer",
 )
 
+# Verified tokens, keyed by a keyed BLAKE2b digest of the raw token (so the
+# cache never holds bearer credentials) and mapped to (username, exp). A
+# replayed token skips signature verification and claim parsing entirely.
+# Entries live for at most TOKEN_CACHE_TTL_SECONDS and never past the token's
+# own expiry; tokens that fail verification are never cached.
+TOKEN_CACHE_TTL_SECONDS = 5
+TOKEN_CACHE_MAX_SIZE = 50_000
 
-async def get_current_user(
+# Keying the digest with the signing secret makes it a MAC: without the
+# secret nobody can craft a token whose digest collides with a cached entry.
+# BLAKE2b keys are capped at 64 bytes, so the secret is compressed to that.
+_TOKEN_CACHE_MAC_KEY = hashlib.blake2b(auth_settings.SECRET_KEY.encode()).digest()
+
+
+def _token_cache_expiry(_key: bytes, value: tuple[str, float], now: float) -> float:
+    """Expire a cache entry after the TTL or at token expiry, whichever is first."""
+    return min(now + TOKEN_CACHE_TTL_SECONDS, value[1])
+
+
+_token_cache: TLRUCache[bytes, tuple[str, float]] = TLRUCache(
+    maxsize=TOKEN_CACHE_MAX_SIZE, ttu=_token_cache_expiry, timer=time.time
+)
+_token_cache_lock = threading.RLock()
+
+
+def clear_token_cache() -> None:
+    """Drop every cached token verification."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def _username_from_token(token: str) -> str:
+    """Resolve the token subject, verifying the JWT only on a cache miss."""
+    key = hashlib.blake2b(
+        token.encode(), digest_size=16, key=_TOKEN_CACHE_MAC_KEY
+    ).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    username, expires_at = utils.extract_username_and_expiry(token)
+    with _token_cache_lock:
+        _token_cache[key] = (username, expires_at)
+    return username
+
+
+def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[Session, Depends(get_db)],
 ) -> models.User:
-    """Get current authenticated user from JWT token."""
+    """Get current authenticated user from JWT token.
+
+    Both the token verification and the user lookup are served from
+    short-lived in-process caches, so a replayed token costs no crypto and
+    no database round trip. Password hashes are never checked here; Argon2
+    is only paid by the login and password-change endpoints.
+    """
     try:
-        username = utils.extract_username_from_token(token)
+        username = _username_from_token(token)
     except InvalidTokenExceptionError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=WWW_AUTHENTICATE_HEADERS,
         ) from e
 
     user = service.auth_service.get_user_by_username(db, username=username)
@@ -37,7 +95,7 @@ async def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=WWW_AUTHENTICATE_HEADERS,
         )
 
     return user
@@ -0,0 +1,138 @@
+"""Cross-process user cache invalidation over Postgres LISTEN/NOTIFY.
+
+Each worker keeps its own in-memory user cache (see ``app.auth.service``).
+Updates to a user are announced on ``USER_CACHE_CHANNEL`` when they commit;
+this listener runs in every worker and evicts the announced user so a role
+change or deactivation made elsewhere takes effect immediately instead of
+after the cache TTL.
+"""
+
+import logging
+import select
+import socket
+import threading
+
+import psycopg2
+import psycopg2.extensions
+from sqlalchemy import Engine
+
+from .constants import USER_CACHE_CHANNEL
+from .service import clear_user_cache, evict_cached_user
+
+logger = logging.getLogger(__name__)
+
+# Pause before reconnecting after the listening connection fails
+RECONNECT_DELAY_SECONDS = 5.0
+# Idle time after which the listener pings the server to prove the
+# connection is still alive
+KEEPALIVE_INTERVAL_SECONDS = 30.0
+
+# libpq TCP settings for the listening connection. A LISTEN connection is
+# idle most of the time, so without these a peer that vanished silently
+# (failover, NAT timeout) would go unnoticed until the kernel gives up.
+_TCP_KEEPALIVE_PARAMS = {
+    "keepalives": 1,
+    "keepalives_idle": int(KEEPALIVE_INTERVAL_SECONDS),
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+    # Also bounds how long the keepalive ping may wait for an answer
+    "tcp_user_timeout": int(KEEPALIVE_INTERVAL_SECONDS * 1000),
+}
+
+
+class UserCacheListener:
+    """Background thread that evicts users announced by other workers."""
+
+    def __init__(self, engine: Engine) -> None:
+        """Initialize the listener.
+
+        Args:
+            engine: Engine whose database (and connection arguments) to
+                listen on. The listener opens its own dedicated connection
+                rather than holding one from the pool.
+        """
+        self._engine = engine
+        self._stop = threading.Event()
+        self._listening = threading.Event()
+        self._thread: threading.Thread | None = None
+        # stop() writes to this pair to wake the thread out of select() at once
+        self._wake: tuple[socket.socket, socket.socket] | None = None
+
+    def start(self) -> None:
+        """Start listening in a daemon thread."""
+        self._stop.clear()
+        self._wake = socket.socketpair()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._wake[0],),
+            name="user-cache-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop listening and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is None or self._wake is None:
+            return
+        wake_reader, wake_writer = self._wake
+        wake_writer.send(b"\0")
+        self._thread.join(timeout=RECONNECT_DELAY_SECONDS)
+        wake_reader.close()
+        wake_writer.close()
+        self._thread = None
+        self._wake = None
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        """Open an autocommit connection subscribed to the channel."""
+        cargs, cparams = self._engine.dialect.create_connect_args(self._engine.url)
+        conn = psycopg2.connect(*cargs, **{**_TCP_KEEPALIVE_PARAMS, **cparams})
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {USER_CACHE_CHANNEL}")
+        return conn
+
+    def _run(self, wake_reader: socket.socket) -> None:
+        """Listen until stopped, reconnecting after connection failures."""
+        while not self._stop.is_set():
+            try:
+                conn = self._connect()
+            except psycopg2.Error:
+                logger.warning("User cache listener failed to connect", exc_info=True)
+                self._stop.wait(RECONNECT_DELAY_SECONDS)
+                continue
+
+            # Anything announced while we weren't listening was missed.
+            clear_user_cache()
+            self._listening.set()
+            try:
+                self._drain(conn, wake_reader)
+            except psycopg2.Error:
+                logger.warning("User cache listener lost its connection", exc_info=True)
+                self._stop.wait(RECONNECT_DELAY_SECONDS)
+            finally:
+                self._listening.clear()
+                conn.close()
+
+    def _drain(
+        self, conn: psycopg2.extensions.connection, wake_reader: socket.socket
+    ) -> None:
+        """Evict announced users until stopped.
+
+        After ``KEEPALIVE_INTERVAL_SECONDS`` without traffic the connection is
+        pinged with ``SELECT 1``; if that fails the ``psycopg2.Error`` reaches
+        ``_run``, which reconnects.
+        """
+        while not self._stop.is_set():
+            readable, _, _ = select.select(
+                [conn, wake_reader], [], [], KEEPALIVE_INTERVAL_SECONDS
+            )
+            if not readable:
+                # The ping also collects any notifications that raced it
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            elif conn in readable:
+                conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                evict_cached_user(notify.payload or None)
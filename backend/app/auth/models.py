@@ -15,7 +15,11 @@ class User(BaseModel):
     username: Mapped[str] = mapped_column(
         String(50), unique=True, nullable=False, index=True
     )
-    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Deferred: only login and password changes read the hash, so the
+    # per-request user lookup doesn't drag it through the driver.
+    password_hash: Mapped[str] = mapped_column(
+        String(255), nullable=False, deferred=True
+    )
     first_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     last_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     preferred_currency: Mapped[str] = mapped_column(
@@ -1,13 +1,14 @@
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.dependencies import get_db
 
-from . import schemas, service
+from . import models, schemas, service
+from .constants import USER_CACHE_CONTROL, WWW_AUTHENTICATE_HEADERS
 from .dependencies import CurrentActiveUser, CurrentAdminUser
 from .exceptions import (
     IncorrectPasswordExceptionError,
@@ -18,6 +19,15 @@ from .exceptions import (
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# User endpoints return ORM objects and let ``response_model`` validate them
+# once; building a UserResponse in the handler would be dumped and validated
+# a second time by FastAPI.
+#
+# Handlers that query the database through the synchronous Session, or hash
+# passwords with Argon2, are plain ``def`` so FastAPI runs them in the
+# threadpool; as ``async def`` they would block the event loop. Handlers
+# that only read the already-resolved current user stay ``async``.
+
 # Create dependency aliases to fix B008
 DatabaseDep = Annotated[Session, Depends(get_db)]
 
@@ -27,21 +37,23 @@ DatabaseDep = Annotated[Session, Depends(get_db)]
     response_model=schemas.UserResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def register(
+def register(
     user_data: schemas.UserCreate,
     db: DatabaseDep,
     _admin: CurrentAdminUser,
-) -> schemas.UserResponse:
+) -> models.User:
     """Create a new user. Requires admin role."""
+    # The admin check only read; end its transaction so the connection isn't
+    # left idle in transaction while create_user spends time in Argon2.
+    db.rollback()
     try:
-        user = service.auth_service.create_user(db, user_data)
-        return schemas.UserResponse.from_orm(user)
+        return service.auth_service.create_user(db, user_data)
     except UserAlreadyExistsExceptionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
 @router.post("/login", response_model=schemas.Token)
-async def login(
+def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: DatabaseDep,
 ) -> schemas.Token:
@@ -59,31 +71,61 @@ async def login(
         raise HTTPException(
             status_code=e.status_code,
             detail=e.message,
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=WWW_AUTHENTICATE_HEADERS,
         ) from e
 
 
+def _user_etag(user: models.User) -> str:
+    """Weak ETag for a user's profile; every ORM update bumps updated_at."""
+    return f'W/"{user.id.hex}-{user.updated_at.timestamp():.6f}"'
+
+
+def _conditional_user_response(
+    request: Request, response: Response, user: models.User
+) -> models.User | Response:
+    """Return the user, or an empty 304 if the client's copy is current.
+
+    Sets ``ETag`` and ``Cache-Control`` either way, so clients polling a
+    profile skip serialization and the response body when nothing changed.
+    """
+    etag = _user_etag(user)
+    headers = {"ETag": etag, "Cache-Control": USER_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return user
+
+
 @router.get("/me", response_model=schemas.UserResponse)
 async def get_current_user_info(
+    request: Request,
+    response: Response,
     current_user: CurrentActiveUser,
-) -> schemas.UserResponse:
-    """Get current user information."""
-    return schemas.UserResponse.from_orm(current_user)
+) -> models.User | Response:
+    """Get current user information.
+
+    Answers a matching ``If-None-Match`` with ``304 Not Modified``.
+    """
+    return _conditional_user_response(request, response, current_user)
 
 
 @router.put("/me", response_model=schemas.UserResponse)
-async def update_current_user(
+def update_current_user(
     user_update: schemas.UserUpdate,
     current_user: CurrentActiveUser,
     db: DatabaseDep,
-) -> schemas.UserResponse:
+) -> models.User:
     """Update current user information."""
-    updated_user = service.auth_service.update_user(db, current_user, user_update)
-    return schemas.UserResponse.from_orm(updated_user)
+    return service.auth_service.update_user(db, current_user, user_update)
 
 
 @router.put("/me/password")
-async def update_current_user_password(
+def update_current_user_password(
     password_update: schemas.UserUpdatePassword,
     current_user: CurrentActiveUser,
     db: DatabaseDep,
@@ -98,44 +140,50 @@ async def update_current_user_password(
 
 # Admin user management endpoints
 @router.get("/users", response_model=list[schemas.UserResponse])
-async def list_users(
+def list_users(
     _admin: CurrentAdminUser,
     db: DatabaseDep,
-) -> list[schemas.UserResponse]:
+) -> list[models.User]:
     """List all users. Requires admin role."""
-    return service.auth_service.list_all_users(db)  # type: ignore[return-value]
+    return service.auth_service.list_all_users(db)
 
 
 @router.get("/users/{user_id}", response_model=schemas.UserResponse)
-async def get_user(
+def get_user(
     user_id: UUID,
+    request: Request,
+    response: Response,
     _admin: CurrentAdminUser,
     db: DatabaseDep,
-) -> schemas.UserResponse:
-    """Get a user by ID. Requires admin role."""
+) -> models.User | Response:
+    """Get a user by ID. Requires admin role.
+
+    Answers a matching ``If-None-Match`` with ``304 Not Modified``.
+    """
     try:
-        return service.auth_service.get_user_by_id_admin(db, user_id)  # type: ignore[return-value]
+        user = service.auth_service.get_user_by_id_admin(db, user_id)
     except UserNotFoundExceptionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
+    return _conditional_user_response(request, response, user)
 
 
 @router.put("/users/{user_id}", response_model=schemas.UserResponse)
-async def update_user(
+def update_user(
     user_id: UUID,
     user_update: schemas.UserAdminUpdate,
     _admin: CurrentAdminUser,
     db: DatabaseDep,
-) -> schemas.UserResponse:
+) -> models.User:
     """Update a user. Requires admin role."""
     try:
         user = service.auth_service.get_user_by_id_admin(db, user_id)
-        return service.auth_service.update_user_admin(db, user, user_update)  # type: ignore[return-value]
+        return service.auth_service.update_user_admin(db, user, user_update)
     except UserNotFoundExceptionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def deactivate_user(
+def deactivate_user(
     user_id: UUID,
     _admin: CurrentAdminUser,
     db: DatabaseDep,
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas import AppBaseModel
 
@@ -81,19 +81,27 @@ class UserUpdatePassword(AppBaseModel):
     )
 
 
-class UserResponse(UserBase):
-    """User response schema for API responses."""
+class UserResponse(BaseModel):
+    """User response schema for API responses.
+
+    Built from stored rows that were validated on the way in, so it declares
+    plain field types instead of inheriting the input constraints of
+    ``UserBase``.
+    """
 
     id: uuid.UUID
+    username: str
+    first_name: str | None = None
+    last_name: str | None = None
+    preferred_currency: CurrencyCode
+    locale: str
+    role: UserRole
     active: bool
     active_household_id: uuid.UUID | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration for ORM compatibility."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserInDB(UserResponse):
@@ -1,12 +1,17 @@
-from datetime import timedelta
+import threading
+import time
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import bindparam, event, func, inspect, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, Session, make_transient_to_detached
 
 from . import models, schemas, utils
 from .config import auth_settings
-from .constants import JWT_TOKEN_PREFIX
+from .constants import JWT_TOKEN_PREFIX, USER_CACHE_CHANNEL
 from .exceptions import (
     IncorrectPasswordExceptionError,
     InvalidCredentialsExceptionError,
@@ -14,84 +19,250 @@ from .exceptions import (
     UserNotFoundExceptionError,
 )
 
+# Column snapshots of active users, keyed by username. get_current_user
+# resolves the user on every authenticated request, so serving repeat
+# lookups from memory saves a database round trip per request. Entries are
+# evicted whenever a User row is flushed (see _evict_written_user), and other
+# worker processes are told to do the same over LISTEN/NOTIFY; the short TTL
+# bounds staleness if a notification is missed.
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10_000
+
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS, timer=time.monotonic
+)
+_user_cache_lock = threading.RLock()
+
+# One lock per username whose lookup is in flight. When a popular user's
+# entry expires or is evicted, every request that misses at the same moment
+# waits for the first one's SELECT and is then served from the cache, rather
+# than each issuing the same query.
+_user_loads: dict[str, threading.Lock] = {}
+
+
+def _snapshot_user(user: models.User) -> dict[str, Any]:
+    """Copy the loaded column values of a user into a plain dict.
+
+    Deferred columns that were never loaded are left out, so a restored
+    user loads them lazily on first access just like a queried one.
+    """
+    loaded = inspect(user).dict
+    return {
+        attr.key: loaded[attr.key]
+        for attr in inspect(models.User).column_attrs
+        if attr.key in loaded
+    }
+
+
+def _restore_user(db: Session, snapshot: dict[str, Any]) -> models.User:
+    """Attach a cached user snapshot to the session without emitting a SELECT.
+
+    Reuses the instance already present in the session's identity map, if
+    any, so callers never end up with two objects for the same row.
+    """
+    key = Session.identity_key(models.User, snapshot["id"])
+    user = db.identity_map.get(key)
+    if user is None:
+        user = models.User(**snapshot)
+        make_transient_to_detached(user)
+        db.add(user)
+    return user
+
+
+def clear_user_cache() -> None:
+    """Drop every cached user snapshot."""
+    with _user_cache_lock:
+        _user_cache.clear()
+
+
+def evict_cached_user(username: str | None) -> None:
+    """Drop one cached user, or every entry when the username is unknown."""
+    with _user_cache_lock:
+        if username is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(username, None)
+
+
+@event.listens_for(models.User, "after_insert")
+@event.listens_for(models.User, "after_update")
+def _evict_written_user(
+    _mapper: Mapper[models.User],
+    _connection: Connection,
+    target: models.User,
+) -> None:
+    """Evict a user from the cache whenever its row is inserted or updated.
+
+    Hooking the mapper covers every write path — profile and password
+    updates, admin changes, deactivation and household switches made from
+    other domains — without each of them having to know about the cache.
+    If the username isn't loaded on this instance the entry can't be
+    targeted, so the whole cache is dropped instead.
+    """
+    evict_cached_user(inspect(target).dict.get("username"))
+
+
+@event.listens_for(models.User, "after_update")
+def _announce_updated_user(
+    _mapper: Mapper[models.User],
+    connection: Connection,
+    target: models.User,
+) -> None:
+    """Tell other worker processes to evict the user once this write commits.
+
+    NOTIFY is transactional, so a rolled-back update announces nothing. An
+    empty payload asks listeners to clear their whole cache (see
+    ``app.auth.invalidation``).
+    """
+    username = inspect(target).dict.get("username") or ""
+    connection.execute(select(func.pg_notify(USER_CACHE_CHANNEL, username)))
+
+
+# Verified against when a login names no active user, so that path pays the
+# same Argon2 cost as a wrong password and response timing doesn't reveal
+# which usernames exist.
+_DUMMY_PASSWORD_HASH = utils.get_password_hash("colony-timing-equalizer")
+
+
+# Hot lookup built as a lambda statement: the statement and its cache key
+# are constructed once per process instead of on every call. Lookups by
+# primary key go through Session.get instead.
+_active_user_by_username = lambda_stmt(
+    lambda: select(models.User).where(
+        models.User.username == bindparam("username"), models.User.active
+    )
+)
+
+# Login reads just the two columns it checks, so a failed attempt never
+# builds an ORM object.
+_active_credentials_by_username = lambda_stmt(
+    lambda: select(models.User.id, models.User.password_hash).where(
+        models.User.username == bindparam("username"), models.User.active
+    )
+)
+
 
 class AuthService:
     """Authentication service for user management and token handling."""
 
     @staticmethod
     def create_user(db: Session, user_create: schemas.UserCreate) -> models.User:
-        """Create a new user."""
-        existing_user = (
-            db.query(models.User)
-            .filter(models.User.username == user_create.username)
-            .first()
-        )
-
-        if existing_user:
-            raise UserAlreadyExistsExceptionError(user_create.username)
+        """Create a new user.
 
+        Inserts with ``ON CONFLICT (username) DO NOTHING``: a taken username
+        comes back as an empty RETURNING instead of an existence SELECT
+        before every insert or a failed statement to recover from.
+        """
         hashed_password = utils.get_password_hash(user_create.password)
 
-        db_user = models.User(
-            username=user_create.username,
-            password_hash=hashed_password,
-            first_name=user_create.first_name,
-            last_name=user_create.last_name,
-            preferred_currency=user_create.preferred_currency,
-            locale=user_create.locale,
-            role=user_create.role,
+        stmt = (
+            pg_insert(models.User)
+            .values(
+                username=user_create.username,
+                password_hash=hashed_password,
+                first_name=user_create.first_name,
+                last_name=user_create.last_name,
+                preferred_currency=user_create.preferred_currency,
+                locale=user_create.locale,
+                role=user_create.role,
+            )
+            .on_conflict_do_nothing(index_elements=[models.User.username])
+            .returning(models.User)
         )
-
-        try:
-            db.add(db_user)
-            db.commit()
-            db.refresh(db_user)
-            return db_user
-        except IntegrityError as e:
+        db_user = db.scalars(stmt).one_or_none()
+        if db_user is None:
             db.rollback()
-            raise UserAlreadyExistsExceptionError(user_create.username) from e
+            raise UserAlreadyExistsExceptionError(user_create.username)
+
+        db.commit()
+        db.refresh(db_user)
+        return db_user
 
     @staticmethod
     def authenticate_user(db: Session, username: str, password: str) -> models.User:
         """Authenticate user with username and password."""
-        user = (
-            db.query(models.User)
-            .filter(models.User.username == username, models.User.active)
-            .first()
-        )
+        credentials = db.execute(
+            _active_credentials_by_username, {"username": username}
+        ).one_or_none()
 
-        if not user:
+        if credentials is None:
+            utils.verify_password(password, _DUMMY_PASSWORD_HASH)
+            raise InvalidCredentialsExceptionError
+
+        verified, updated_hash = utils.verify_and_update_password(
+            password, credentials.password_hash
+        )
+        if not verified:
             raise InvalidCredentialsExceptionError
 
-        if not utils.verify_password(password, user.password_hash):
+        # Only a successful login pays for hydrating the full user.
+        user = db.get(models.User, credentials.id)
+        if user is None:
             raise InvalidCredentialsExceptionError
 
+        if updated_hash is not None:
+            # The Argon2 parameters were retuned since this hash was made;
+            # upgrade it now, while the plaintext is at hand.
+            user.password_hash = updated_hash
+            db.commit()
+
         return user
 
     @staticmethod
     def get_user_by_username(db: Session, username: str) -> models.User | None:
-        """Get user by username."""
-        return (
-            db.query(models.User)
-            .filter(models.User.username == username, models.User.active)
-            .first()
-        )
+        """Get an active user by username, served from the user cache if present.
+
+        Concurrent misses for the same username share a single SELECT.
+        """
+        with _user_cache_lock:
+            snapshot = _user_cache.get(username)
+        if snapshot is not None:
+            return _restore_user(db, snapshot)
+
+        with _user_cache_lock:
+            load_lock = _user_loads.setdefault(username, threading.Lock())
+        with load_lock:
+            # Whoever held the lock before us may have just filled the entry.
+            with _user_cache_lock:
+                snapshot = _user_cache.get(username)
+            if snapshot is not None:
+                return _restore_user(db, snapshot)
+
+            try:
+                user = db.execute(
+                    _active_user_by_username, {"username": username}
+                ).scalar_one_or_none()
+                if user is not None:
+                    with _user_cache_lock:
+                        _user_cache[username] = _snapshot_user(user)
+            finally:
+                with _user_cache_lock:
+                    if _user_loads.get(username) is load_lock:
+                        del _user_loads[username]
+        return user
 
     @staticmethod
-    def get_user_by_id(db: Session, user_id: str) -> models.User | None:
-        """Get user by ID."""
-        return (
-            db.query(models.User)
-            .filter(models.User.id == user_id, models.User.active)
-            .first()
-        )
+    def get_user_by_id(db: Session, user_id: UUID) -> models.User | None:
+        """Get an active user by ID.
+
+        A primary-key lookup, so ``Session.get`` answers from the identity map
+        when the user is already loaded and only emits SQL otherwise.
+        """
+        user = db.get(models.User, user_id)
+        return user if user is not None and user.active else None
 
     @staticmethod
     def update_user(
         db: Session, user: models.User, user_update: schemas.UserUpdate
     ) -> models.User:
-        """Update user information."""
-        update_data = user_update.dict(exclude_unset=True)
+        """Update user information.
+
+        Changes go through the unit of work rather than a Core UPDATE so the
+        user cache eviction and change announcement events still fire.
+        """
+        update_data = user_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return user
 
         for field, value in update_data.items():
             setattr(user, field, value)
@@ -120,12 +291,12 @@ class AuthService:
     @staticmethod
     def list_all_users(db: Session) -> list[models.User]:
         """Return all users (including inactive) ordered by creation date."""
-        return db.query(models.User).order_by(models.User.created_at).all()
+        return list(db.scalars(select(models.User).order_by(models.User.created_at)))
 
     @staticmethod
     def get_user_by_id_admin(db: Session, user_id: UUID) -> models.User:
         """Get any user by ID (admin view — includes inactive users)."""
-        user = db.query(models.User).filter(models.User.id == user_id).first()
+        user = db.get(models.User, user_id)
         if user is None:
             raise UserNotFoundExceptionError
         return user
@@ -138,6 +309,9 @@ class AuthService:
     ) -> models.User:
         """Apply admin update (can change role and active status)."""
         update_data = update.model_dump(exclude_unset=True)
+        if not update_data:
+            return user
+
         for field, value in update_data.items():
             setattr(user, field, value)
         db.commit()
@@ -147,18 +321,16 @@ class AuthService:
     @staticmethod
     def create_access_token(user: models.User) -> schemas.Token:
         """Create access token for user."""
-        access_token_expires = timedelta(
-            minutes=auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
         access_token = utils.create_access_token(
-            data={"sub": user.username}, expires_delta=access_token_expires
+            data={"sub": user.username},
+            expires_delta=auth_settings.access_token_expire_delta,
         )
 
-        return schemas.Token(
+        # Every field is produced here, so skip re-validating them.
+        return schemas.Token.model_construct(
             access_token=access_token,
             token_type=JWT_TOKEN_PREFIX,
-            expires_in=auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            * 60,  # Convert to seconds
+            expires_in=auth_settings.access_token_expire_seconds,
         )
 
 
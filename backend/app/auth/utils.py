@@ -1,63 +1,110 @@
+import os
+import threading
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import jwt
 from jwt.exceptions import InvalidTokenError
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
 from .config import auth_settings
 from .exceptions import InvalidTokenExceptionError
 
-# Initialize password hasher
-pwd_context = PasswordHash.recommended()
+# Initialize password hasher; the work factor is pinned via AuthSettings
+pwd_context = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=auth_settings.ARGON2_TIME_COST,
+            memory_cost=auth_settings.ARGON2_MEMORY_COST,
+            parallelism=auth_settings.ARGON2_PARALLELISM,
+        ),
+    ),
+)
+# Argon2 is the only scheme ever stored, so call it directly and skip
+# PasswordHash's per-call scan that sniffs each hash's prefix for a match.
+_hasher = pwd_context.current_hasher
+# Hashing runs in FastAPI's threadpool (40 threads by default); cap how many
+# threads may hold an Argon2 memory block at the same time.
+_hash_slots = threading.BoundedSemaphore(
+    auth_settings.ARGON2_MAX_CONCURRENCY or os.process_cpu_count() or 1
+)
+
+# Signing material resolved once instead of on every encode/decode
+_JWT_KEY = auth_settings.SECRET_KEY.encode()
+_JWT_ALGORITHMS = [auth_settings.ALGORITHM]
+# Claims that are identical on every access token, and the default lifetime
+_ACCESS_TOKEN_CLAIMS = {"type": "access"}
+_ACCESS_TOKEN_LIFETIME = auth_settings.access_token_expire_delta
+# Dedicated PyJWT instance with its decode options baked in; passing options
+# to the module-level jwt.decode merges them into the defaults on every call.
+# Every token we issue carries exp and sub; one without an expiry would never
+# lapse and could not be bounded in the verified-token cache.
+_jwt = jwt.PyJWT(options={"require": ["exp", "sub"]})
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    with _hash_slots:
+        return _hasher.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password and rehash it if it was hashed with stale parameters.
+
+    Returns:
+        Whether the password matches, and a replacement hash when the stored
+        one no longer matches the configured Argon2 parameters.
+    """
+    with _hash_slots:
+        if not _hasher.verify(plain_password, hashed_password):
+            return False, None
+        if _hasher.check_needs_rehash(hashed_password):
+            return True, _hasher.hash(plain_password)
+    return True, None
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
-    return pwd_context.hash(password)
+    with _hash_slots:
+        return _hasher.hash(password)
 
 
 def create_access_token(
     data: dict[str, Any], expires_delta: timedelta | None = None
 ) -> str:
     """Create JWT access token."""
-    to_encode = data.copy()
+    # One clock read so exp and iat describe the same instant
+    now = datetime.now(UTC)
+    expire = now + (expires_delta or _ACCESS_TOKEN_LIFETIME)
+    to_encode = {**data, **_ACCESS_TOKEN_CLAIMS, "exp": expire, "iat": now}
 
-    if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
-    else:
-        expire = datetime.now(UTC) + timedelta(
-            minutes=auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
-    to_encode.update({"exp": expire, "iat": datetime.now(UTC), "type": "access"})
-
-    return jwt.encode(
-        to_encode, auth_settings.SECRET_KEY, algorithm=auth_settings.ALGORITHM
-    )
+    return _jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHMS[0])
 
 
 def verify_token(token: str) -> dict[str, Any]:
     """Verify and decode JWT token."""
     try:
-        return jwt.decode(
-            token, auth_settings.SECRET_KEY, algorithms=[auth_settings.ALGORITHM]
-        )
+        return _jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
     except InvalidTokenError as e:
         raise InvalidTokenExceptionError from e
 
 
-def extract_username_from_token(token: str) -> str:
-    """Extract username from JWT token."""
+def extract_username_and_expiry(token: str) -> tuple[str, float]:
+    """Extract username and expiry (epoch seconds) from JWT token."""
     payload = verify_token(token)
-    username = payload.get("sub")
+    username = payload["sub"]
 
     if not username or not isinstance(username, str):
         raise InvalidTokenExceptionError
 
+    # PyJWT has already checked that exp is a number in the future
+    return username, float(payload["exp"])
+
+
+def extract_username_from_token(token: str) -> str:
+    """Extract username from JWT token."""
+    username, _ = extract_username_and_expiry(token)
     return username
@@ -1,3 +1,8 @@
+from datetime import timedelta
+from functools import cached_property, lru_cache
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings  # Changed import
 
 
@@ -6,12 +11,39 @@ class AuthSettings(BaseSettings):
 
     # JWT Settings
     SECRET_KEY: str = "your-secret-key-change-in-production"
-    ALGORITHM: str = "HS256"
+    # Only shared-secret HMAC algorithms fit the single SECRET_KEY; PyJWT
+    # computes them with the stdlib hmac module on top of OpenSSL's SHA-2.
+    ALGORITHM: Literal["HS256", "HS384", "HS512"] = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing (Argon2id). Paid only on login, password change and
+    # user creation — authenticated requests never recompute a hash. Defaults
+    # follow OWASP's m=46 MiB, t=1, p=1 profile, which bounds the memory and
+    # CPU of each check; load-test before raising them. Stored hashes made
+    # with other parameters are upgraded on the user's next login.
+    ARGON2_TIME_COST: int = 1
+    ARGON2_MEMORY_COST: int = 46 * 1024  # KiB
+    ARGON2_PARALLELISM: int = 1
+    # Upper bound on hashes computed at once across the threadpool, so peak
+    # Argon2 memory stays near MEMORY_COST x this value. Defaults to the CPUs
+    # this process may run on; more concurrent hashes than cores only adds
+    # memory, not speed. That count ignores cgroup CPU quotas, so set this
+    # explicitly in containers.
+    ARGON2_MAX_CONCURRENCY: int | None = None
+
     # OAuth2 Settings
     TOKEN_URL: str = "auth/login"
 
+    @cached_property
+    def access_token_expire_delta(self) -> timedelta:
+        """Access token lifetime, derived once from ACCESS_TOKEN_EXPIRE_MINUTES."""
+        return timedelta(minutes=self.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    @cached_property
+    def access_token_expire_seconds(self) -> int:
+        """Access token lifetime in seconds, as reported to clients."""
+        return self.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
     class Config:
         """Configuration for environment variable prefix."""
 
@@ -49,11 +81,12 @@ class Settings(BaseSettings):
     # CORS
     ALLOWED_HOSTS: list = ["http://localhost:3000"]
 
-    # Auth settings
-    AUTH: AuthSettings = AuthSettings()
+    # Auth settings — built with the parent rather than at class definition,
+    # so the environment is read once and the instance is not deep-copied
+    AUTH: AuthSettings = Field(default_factory=AuthSettings)
 
     # Admin settings
-    ADMIN: AdminSettings = AdminSettings()
+    ADMIN: AdminSettings = Field(default_factory=AdminSettings)
 
     class Config:
         """Configuration for environment file."""
@@ -61,4 +94,17 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading them on first use.
+
+    Reading ``.env`` and validating every field happens exactly once per
+    process.
+
+    Returns:
+        The cached Settings instance.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -15,7 +15,7 @@ from .exceptions import (
 from .models import Cycle, CycleExpense, CycleIncome
 
 
-async def get_cycle_by_id(
+def get_cycle_by_id(
     cycle_id: str,
     current_household: CurrentActiveHousehold,
     db: Annotated[Session, Depends(get_db)],
@@ -42,7 +42,7 @@ async def get_cycle_by_id(
     return cycle
 
 
-async def get_cycle_expense_by_id(
+def get_cycle_expense_by_id(
     cycle_id: str,
     expense_id: str,
     current_household: CurrentActiveHousehold,
@@ -79,7 +79,7 @@ async def get_cycle_expense_by_id(
     return expense
 
 
-async def get_cycle_income_by_id(
+def get_cycle_income_by_id(
     cycle_id: str,
     income_id: str,
     current_household: CurrentActiveHousehold,
@@ -1,8 +1,7 @@
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Connection, Engine, create_engine, inspect
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config import settings
 
@@ -11,17 +10,49 @@ engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using them
     echo=settings.DEBUG,  # Show SQL queries in debug mode
+    query_cache_size=1200,  # Compiled-statement cache entries (default 500)
+    # Multi-row INSERTs already go out as one INSERT ... VALUES per page of
+    # rows; this also batches flushes that UPDATE or DELETE many rows
+    executemany_mode="values_plus_batch",
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create Base class for models
+# The one declarative base, and so the one MetaData, every model registers on
 Base = declarative_base()
 
 
-def get_db() -> Generator:
-    """Database session dependency."""
+def create_missing_tables(bind: Engine | Connection = engine) -> None:
+    """Create the tables registered on ``Base.metadata`` that don't exist yet.
+
+    ``create_all`` probes every table and enum type with its own query
+    before issuing any DDL. Listing the existing tables once lets the usual
+    case, where the schema is already in place, finish after a single round
+    trip; only missing tables are handed to ``create_all``. The model
+    modules must be imported first so their tables are registered.
+
+    Args:
+        bind: Engine or connection to create the tables through.
+    """
+    existing = set(inspect(bind).get_table_names())
+    missing = [
+        table for table in Base.metadata.sorted_tables if table.name not in existing
+    ]
+    if missing:
+        Base.metadata.create_all(bind=bind, tables=missing)
+
+
+def get_db() -> Generator[Session]:
+    """Database session dependency.
+
+    FastAPI caches dependency results per request, keyed on the callable,
+    so every ``Depends(get_db)`` in a request's dependency tree — the route
+    handler, ``get_current_user``, ``get_current_active_household`` —
+    shares this one session. Always depend on this function (directly or
+    via the ``app.dependencies`` re-export) and never pass
+    ``use_cache=False``, or each sub-dependency opens its own session.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -2,7 +2,7 @@ import logging
 from typing import Any
 
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -105,13 +105,13 @@ class ExternalServiceError(AppExceptionError):
 async def app_exception_handler(
     request: Request,
     exc: Exception,  # Change from AppExceptionError to Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Global exception handler for AppExceptionError instances."""
     # Type guard to ensure we're dealing with AppExceptionError
     if not isinstance(exc, AppExceptionError):
         # This shouldn't happen, but handle gracefully
         logger.error(f"Unexpected exception type in app_exception_handler: {type(exc)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -134,10 +134,10 @@ async def app_exception_handler(
         },
     )
 
-    return JSONResponse(status_code=exc.status_code, content=exc.to_dict())
+    return ORJSONResponse(status_code=exc.status_code, content=exc.to_dict())
 
 
-async def http_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Global exception handler for HTTPException instances."""
     # Type guard
     if not isinstance(exc, HTTPException):
@@ -154,7 +154,7 @@ async def http_exception_handler(request: Request, exc: Exception) -> JSONRespon
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -170,7 +170,7 @@ async def http_exception_handler(request: Request, exc: Exception) -> JSONRespon
 async def validation_exception_handler(
     request: Request,
     exc: Exception,  # Change from ValueError to Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Global exception handler for validation errors."""
     # Type guard
     if not isinstance(exc, ValueError):
@@ -181,7 +181,7 @@ async def validation_exception_handler(
         extra={"error": str(exc), "url": str(request.url), "method": request.method},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "success": False,
@@ -190,7 +190,7 @@ async def validation_exception_handler(
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Global exception handler for any unhandled exceptions."""
     logger.error(
         f"Unhandled exception: {type(exc).__name__} - {exc!s}",
@@ -203,7 +203,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=True,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
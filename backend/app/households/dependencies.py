@@ -11,7 +11,7 @@ from .models import Household
 from .service import household_service
 
 
-async def get_current_active_household(
+def get_current_active_household(
     current_user: CurrentActiveUser,
     db: Annotated[Session, Depends(get_db)],
 ) -> Household:
@@ -1,17 +1,21 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import func, select
 
 from app.activity.router import comments_router, router as activity_router
+from app.auth.invalidation import UserCacheListener
 from app.auth.models import User
 from app.auth.router import router as auth_router
 from app.auth.utils import get_password_hash
 from app.config import settings
 from app.cycles.exchange_rates_router import router as exchange_rates_router
 from app.cycles.router import router as cycles_router
-from app.database import Base, SessionLocal, engine
+from app.database import SessionLocal, create_missing_tables, engine
 from app.exceptions import (
     AppExceptionError,
     app_exception_handler,
@@ -25,6 +29,9 @@ from app.payment_methods.router import router as payment_methods_router
 from app.recurrent_expenses.router import router as recurrent_expenses_router
 from app.recurrent_incomes.router import router as recurrent_incomes_router
 
+# Advisory lock name shared by every worker's startup (see _prepare_database)
+STARTUP_LOCK_NAME = "colony.startup"
+
 
 def _bootstrap_admin() -> None:
     """Create the default admin user and household on first startup.
@@ -79,6 +86,25 @@ def _bootstrap_admin() -> None:
         db.commit()
 
 
+def _prepare_database() -> None:
+    """Create missing tables and bootstrap the admin, one worker at a time.
+
+    Every Uvicorn worker runs the lifespan. Workers starting together
+    against a fresh database would otherwise race to create the same tables
+    and enum types and to insert the same admin user, and the losers would
+    crash on a duplicate error. A session-level advisory lock makes the
+    others wait; by the time they get it there is nothing left to create.
+    """
+    lock_key = func.hashtext(STARTUP_LOCK_NAME)
+    with engine.connect() as conn:
+        conn.execute(select(func.pg_advisory_lock(lock_key)))
+        try:
+            create_missing_tables()
+            _bootstrap_admin()
+        finally:
+            conn.execute(select(func.pg_advisory_unlock(lock_key)))
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     """Ensure schema exists and bootstrap the default admin user on startup.
@@ -86,13 +112,18 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     Production schema management is owned by Alembic — the Helm chart's
     init container runs ``alembic upgrade head`` before the API starts,
     so by the time this lifespan runs, every table already exists and
-    ``create_all`` is a no-op. We keep the ``create_all`` call here as a
-    dev/docker-compose safety net so a fresh ``docker compose up`` works
+    ``create_missing_tables`` is a single catalog query. We keep the call
+    here as a dev/docker-compose safety net so a fresh ``docker compose up`` works
     without a manual migration step.
+
+    Also runs this worker's user cache invalidation listener for the
+    lifetime of the app.
     """
-    Base.metadata.create_all(bind=engine)
-    _bootstrap_admin()
+    _prepare_database()
+    user_cache_listener = UserCacheListener(engine)
+    user_cache_listener.start()
     yield
+    user_cache_listener.stop()
 
 
 def create_app() -> FastAPI:
@@ -104,6 +135,9 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        # Responses are already reduced to JSON-compatible data by the
+        # response models; orjson just renders them faster than json.dumps.
+        default_response_class=ORJSONResponse,
     )
 
     # Add exception handlers
@@ -132,23 +166,32 @@ def create_app() -> FastAPI:
     app.include_router(activity_router, prefix="/api/v1")
     app.include_router(comments_router, prefix="/api/v1")
 
-    @app.get("/")
-    async def root() -> dict[str, str]:
-        """Root endpoint providing basic app info."""
-        return {
+    # Both payloads are fixed for the life of the app, so render them once
+    # here instead of validating and encoding a fresh dict on every request.
+    root_body = orjson.dumps(
+        {
             "message": f"{settings.APP_NAME} is running",
             "version": settings.VERSION,
             "environment": "development",
         }
-
-    @app.get("/health")
-    async def health_check() -> dict[str, str]:
-        """Health check endpoint."""
-        return {
+    )
+    health_body = orjson.dumps(
+        {
             "status": "healthy",
             "service": "colony-api",
             "version": settings.VERSION,
         }
+    )
+
+    @app.get("/", response_model=dict[str, str])
+    async def root() -> Response:
+        """Root endpoint providing basic app info."""
+        return Response(root_body, media_type="application/json")
+
+    @app.get("/health", response_model=dict[str, str])
+    async def health_check() -> Response:
+        """Health check endpoint."""
+        return Response(health_body, media_type="application/json")
 
     return app
 
@@ -9,15 +9,19 @@ from app.households.dependencies import CurrentActiveHousehold
 from . import service
 from .exceptions import PaymentMethodNotFoundExceptionError
 
+# Shared by the dependencies below and the router, so the domain declares its
+# session dependency once
+DatabaseDep = Annotated[Session, Depends(get_db)]
 
-async def get_payment_method_by_id(
+
+def get_payment_method_by_id(
     payment_method_id: str,
     current_household: CurrentActiveHousehold,
-    db: Annotated[Session, Depends(get_db)],
+    db: DatabaseDep,
 ) -> service.models.PaymentMethod:
     """Resolve a payment method by ID, verifying it belongs to the active household."""
     payment_method = service.payment_method_service.get_payment_method_by_id(
-        db, payment_method_id, str(current_household.id)
+        db, payment_method_id, current_household.id
     )
 
     if not payment_method:
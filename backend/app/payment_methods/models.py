@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,30 @@ class PaymentMethod(BaseModel):
     """Payment method belonging to a household."""
 
     __tablename__ = "payment_methods"
+    __table_args__ = (
+        # An active payment method is identified by its name and card digits
+        # within a household; the database rejects duplicates so creation
+        # needs no existence check first. NULL digits compare equal, so two
+        # digitless methods with the same name also collide.
+        Index(
+            "uq_payment_methods_household_name_digits_active",
+            "household_id",
+            "name",
+            "last_4_digits",
+            unique=True,
+            postgresql_where=text("active"),
+            postgresql_nulls_not_distinct=True,
+        ),
+        # Serves the household listing, including the deactivated rows the
+        # partial index above leaves out; created_at last lets the planner
+        # read newest-first straight off the index when that beats sorting.
+        Index(
+            "ix_payment_methods_household_active_created",
+            "household_id",
+            "active",
+            "created_at",
+        ),
+    )
 
     household_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -1,13 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Query, status
 
-from app.dependencies import CurrentActiveUser, get_db
+from app.dependencies import CurrentActiveUser
 from app.households.dependencies import CurrentActiveHousehold
 
-from . import schemas, service
-from .dependencies import PaymentMethodDep
+from . import models, schemas, service
+from .constants import CurrencyCode
+from .dependencies import DatabaseDep, PaymentMethodDep
 from .exceptions import (
     PaymentMethodInUseExceptionError,
     PaymentMethodNameExistsExceptionError,
@@ -15,8 +15,6 @@ from .exceptions import (
 
 router = APIRouter(prefix="/payment-methods", tags=["payment-methods"])
 
-DatabaseDep = Annotated[Session, Depends(get_db)]
-
 
 @router.get(
     "/health",
@@ -36,15 +34,17 @@ async def payment_method_health_check() -> dict[str, str]:
         "Retrieve all payment methods for the active household with optional filters."
     ),
 )
-async def get_payment_methods(
+def get_payment_methods(
     current_household: CurrentActiveHousehold,
     current_user: CurrentActiveUser,
     db: DatabaseDep,
     include_inactive: bool = Query(
         False, description="Include deactivated payment methods (admin only)"
     ),
-    currency: str | None = Query(None, description="Filter by default currency"),
-) -> list[schemas.PaymentMethodResponse]:
+    currency: Annotated[
+        CurrencyCode | None, Query(description="Filter by default currency")
+    ] = None,
+) -> list[models.PaymentMethod]:
     """Get all payment methods for the active household."""
     if include_inactive and current_user.role != "admin":
         raise HTTPException(
@@ -52,10 +52,9 @@ async def get_payment_methods(
             detail="Admin access required",
         )
     active: bool | None = None if include_inactive else True
-    payment_methods = service.payment_method_service.get_payment_methods(
-        db, str(current_household.id), active=active, currency=currency
+    return service.payment_method_service.get_payment_methods(
+        db, current_household.id, active=active, currency=currency
     )
-    return [schemas.PaymentMethodResponse.model_validate(pm) for pm in payment_methods]
 
 
 @router.post(
@@ -65,18 +64,17 @@ async def get_payment_methods(
     summary="Create a new payment method",
     description="Create a new payment method for the active household.",
 )
-async def create_payment_method(
+def create_payment_method(
     payment_method_data: schemas.PaymentMethodCreate,
     current_household: CurrentActiveHousehold,
     current_user: CurrentActiveUser,
     db: DatabaseDep,
-) -> schemas.PaymentMethodResponse:
+) -> models.PaymentMethod:
     """Create a new payment method."""
     try:
-        payment_method = service.payment_method_service.create_payment_method(
-            db, payment_method_data, str(current_household.id), actor=current_user
+        return service.payment_method_service.create_payment_method(
+            db, payment_method_data, current_household.id, actor=current_user
         )
-        return schemas.PaymentMethodResponse.model_validate(payment_method)
     except PaymentMethodNameExistsExceptionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
@@ -87,11 +85,11 @@ async def create_payment_method(
     summary="Get a payment method",
     description="Retrieve a specific payment method by ID.",
 )
-async def get_payment_method(
+def get_payment_method(
     payment_method: PaymentMethodDep,
-) -> schemas.PaymentMethodResponse:
+) -> models.PaymentMethod:
     """Get a specific payment method by ID."""
-    return schemas.PaymentMethodResponse.model_validate(payment_method)
+    return payment_method
 
 
 @router.put(
@@ -100,18 +98,17 @@ async def get_payment_method(
     summary="Update a payment method",
     description="Update an existing payment method.",
 )
-async def update_payment_method(
+def update_payment_method(
     payment_method_data: schemas.PaymentMethodUpdate,
     payment_method: PaymentMethodDep,
     current_user: CurrentActiveUser,
     db: DatabaseDep,
-) -> schemas.PaymentMethodResponse:
+) -> models.PaymentMethod:
     """Update an existing payment method."""
     try:
-        updated_payment_method = service.payment_method_service.update_payment_method(
+        return service.payment_method_service.update_payment_method(
             db, payment_method, payment_method_data, actor=current_user
         )
-        return schemas.PaymentMethodResponse.model_validate(updated_payment_method)
     except PaymentMethodNameExistsExceptionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
@@ -122,15 +119,16 @@ async def update_payment_method(
     summary="Deactivate a payment method",
     description="Deactivate a payment method (soft delete).",
 )
-async def delete_payment_method(
-    payment_method: PaymentMethodDep,
+def delete_payment_method(
+    payment_method_id: str,
+    current_household: CurrentActiveHousehold,
     current_user: CurrentActiveUser,
     db: DatabaseDep,
 ) -> None:
     """Deactivate a payment method (soft delete)."""
     try:
         service.payment_method_service.delete_payment_method(
-            db, payment_method, actor=current_user
+            db, payment_method_id, current_household.id, actor=current_user
         )
     except PaymentMethodInUseExceptionError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
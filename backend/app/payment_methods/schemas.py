@@ -8,10 +8,16 @@ from app.schemas import AppBaseModel
 
 from .constants import CurrencyCode, PaymentMethodType
 
+_LAST_4_DIGITS_RE = re.compile(r"\d{4}")
+
 
 class PaymentMethodBase(AppBaseModel):
     """Base payment method schema with common fields."""
 
+    # Strip in pydantic-core before length checks, so a blank name fails
+    # min_length without a Python validator
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: str = Field(
         ..., min_length=1, max_length=100, description="Payment method name"
     )
@@ -26,35 +32,20 @@ class PaymentMethodBase(AppBaseModel):
         None, description="Last 4 digits of card number (optional)"
     )
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate payment method name."""
-        name = v.strip()
-        if not name:
-            raise ValueError("Payment method name cannot be empty")
-        return name
-
     @field_validator("description")
     @classmethod
     def validate_description(cls, v: str | None) -> str | None:
-        """Validate description."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                return None
-        return v
+        """Treat a blank description as no description."""
+        return v or None
 
     @field_validator("last_4_digits")
     @classmethod
     def validate_last_4_digits(cls, v: str | None) -> str | None:
         """Validate last 4 digits — must be exactly 4 numeric characters."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                return None
-            if not re.fullmatch(r"\d{4}", v):
-                raise ValueError("last_4_digits must be exactly 4 digits")
+        if not v:
+            return None
+        if not _LAST_4_DIGITS_RE.fullmatch(v):
+            raise ValueError("last_4_digits must be exactly 4 digits")
         return v
 
 
@@ -65,6 +56,8 @@ class PaymentMethodCreate(PaymentMethodBase):
 class PaymentMethodUpdate(AppBaseModel):
     """Payment method update schema."""
 
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: str | None = Field(
         None, min_length=1, max_length=100, description="Payment method name"
     )
@@ -82,43 +75,32 @@ class PaymentMethodUpdate(AppBaseModel):
         None, description="Whether the payment method is active"
     )
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str | None) -> str | None:
-        """Validate payment method name."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                raise ValueError("Payment method name cannot be empty")
-        return v
-
     @field_validator("description")
     @classmethod
     def validate_description(cls, v: str | None) -> str | None:
-        """Validate description."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                return None
-        return v
+        """Treat a blank description as no description."""
+        return v or None
 
     @field_validator("last_4_digits")
     @classmethod
     def validate_last_4_digits(cls, v: str | None) -> str | None:
         """Validate last 4 digits — must be exactly 4 numeric characters."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                return None
-            if not re.fullmatch(r"\d{4}", v):
-                raise ValueError("last_4_digits must be exactly 4 digits")
+        if not v:
+            return None
+        if not _LAST_4_DIGITS_RE.fullmatch(v):
+            raise ValueError("last_4_digits must be exactly 4 digits")
         return v
 
 
-class PaymentMethodResponse(PaymentMethodBase):
+class PaymentMethodResponse(BaseModel):
     """Payment method response schema."""
 
     id: uuid.UUID
+    name: str
+    method_type: PaymentMethodType
+    default_currency: CurrencyCode
+    description: str | None = None
+    last_4_digits: str | None = None
     active: bool
     created_at: datetime
     updated_at: datetime
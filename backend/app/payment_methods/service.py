@@ -1,8 +1,9 @@
 import logging
+import uuid
 
-from sqlalchemy import and_
+from sqlalchemy import func, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.activity.constants import ActivityAction, EntityType
 from app.activity.helpers import compute_diff
@@ -10,10 +11,11 @@ from app.activity.service import activity_service
 from app.auth.models import User
 
 from . import models, schemas
-from .constants import MAX_PAYMENT_METHODS_PER_USER
+from .constants import MAX_PAYMENT_METHODS_PER_USER, CurrencyCode
 from .exceptions import (
     PaymentMethodInUseExceptionError,
     PaymentMethodNameExistsExceptionError,
+    PaymentMethodNotFoundExceptionError,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,90 +27,93 @@ class PaymentMethodService:
     @staticmethod
     def get_payment_methods(
         db: Session,
-        household_id: str,
+        household_id: uuid.UUID,
         active: bool | None = None,
-        currency: str | None = None,
+        currency: CurrencyCode | None = None,
     ) -> list[models.PaymentMethod]:
-        """Get all payment methods for a household with optional filters."""
-        query = db.query(models.PaymentMethod).filter(
-            models.PaymentMethod.household_id == household_id
+        """Get all payment methods for a household with optional filters.
+
+        The list response carries only column data, so relationships are set
+        to raise: a schema that starts reading one must add an explicit
+        ``selectinload`` here rather than fall into one lazy SELECT per row.
+        """
+        stmt = (
+            select(models.PaymentMethod)
+            .options(raiseload("*"))
+            .where(models.PaymentMethod.household_id == household_id)
         )
 
         if active is not None:
-            query = query.filter(models.PaymentMethod.active == active)
+            stmt = stmt.where(models.PaymentMethod.active == active)
 
         if currency:
-            query = query.filter(models.PaymentMethod.default_currency == currency)
+            stmt = stmt.where(models.PaymentMethod.default_currency == currency)
 
-        return query.order_by(models.PaymentMethod.created_at.desc()).all()
+        return list(db.scalars(stmt.order_by(models.PaymentMethod.created_at.desc())))
 
     @staticmethod
     def get_payment_method_by_id(
         db: Session,
         payment_method_id: str,
-        household_id: str,
+        household_id: uuid.UUID,
     ) -> models.PaymentMethod | None:
-        """Get payment method by ID and verify it belongs to the household."""
-        return (
-            db.query(models.PaymentMethod)
-            .filter(
-                and_(
-                    models.PaymentMethod.id == payment_method_id,
-                    models.PaymentMethod.household_id == household_id,
-                )
-            )
-            .first()
-        )
+        """Get payment method by ID and verify it belongs to the household.
+
+        Looks the row up by primary key, so a payment method already loaded
+        in this session is returned from the identity map without a query,
+        and a malformed ID is rejected without touching the database.
+        """
+        try:
+            pk = uuid.UUID(payment_method_id)
+        except ValueError:
+            return None
+
+        payment_method = db.get(models.PaymentMethod, pk)
+        if payment_method is None or payment_method.household_id != household_id:
+            return None
+        return payment_method
 
     @staticmethod
     def create_payment_method(
         db: Session,
         payment_method_data: schemas.PaymentMethodCreate,
-        household_id: str,
+        household_id: uuid.UUID,
         actor: User,
     ) -> models.PaymentMethod:
-        """Create a new payment method for a household."""
+        """Create a new payment method for a household.
+
+        Duplicates are left to the partial unique index on active
+        (household, name, last 4 digits): the insert's IntegrityError is
+        reported as PaymentMethodNameExistsExceptionError, with no racy
+        existence SELECT beforehand.
+        """
         logger.info(
             "Creating payment method",
             extra={
-                "household_id": household_id,
+                "household_id": str(household_id),
                 "name": payment_method_data.name,
             },
         )
 
-        existing_count = (
-            db.query(models.PaymentMethod)
-            .filter(
-                and_(
-                    models.PaymentMethod.household_id == household_id,
-                    models.PaymentMethod.active,
-                )
+        # Only whether the cap is reached matters, so stop counting there
+        capped_active = (
+            select(models.PaymentMethod.id)
+            .where(
+                models.PaymentMethod.household_id == household_id,
+                models.PaymentMethod.active,
             )
-            .count()
+            .limit(MAX_PAYMENT_METHODS_PER_USER)
+            .subquery()
         )
+        existing_count = db.execute(
+            select(func.count()).select_from(capped_active)
+        ).scalar_one()
 
         if existing_count >= MAX_PAYMENT_METHODS_PER_USER:
             raise PaymentMethodInUseExceptionError(
                 f"Maximum {MAX_PAYMENT_METHODS_PER_USER} payment methods allowed"
             )
 
-        existing_method = (
-            db.query(models.PaymentMethod)
-            .filter(
-                and_(
-                    models.PaymentMethod.household_id == household_id,
-                    models.PaymentMethod.name == payment_method_data.name,
-                    models.PaymentMethod.last_4_digits
-                    == payment_method_data.last_4_digits,
-                    models.PaymentMethod.active,
-                )
-            )
-            .first()
-        )
-
-        if existing_method:
-            raise PaymentMethodNameExistsExceptionError(payment_method_data.name)
-
         try:
             payment_method = models.PaymentMethod(
                 household_id=household_id,
@@ -137,7 +142,7 @@ class PaymentMethodService:
             logger.info(
                 "Payment method created",
                 extra={
-                    "household_id": household_id,
+                    "household_id": str(household_id),
                     "payment_method_id": str(payment_method.id),
                 },
             )
@@ -148,7 +153,7 @@ class PaymentMethodService:
             db.rollback()
             logger.error(
                 "Failed to create payment method",
-                extra={"household_id": household_id, "error": str(e)},
+                extra={"household_id": str(household_id), "error": str(e)},
             )
             raise PaymentMethodNameExistsExceptionError(payment_method_data.name) from e
 
@@ -159,44 +164,16 @@ class PaymentMethodService:
         payment_method_data: schemas.PaymentMethodUpdate,
         actor: User,
     ) -> models.PaymentMethod:
-        """Update an existing payment method."""
+        """Update an existing payment method.
+
+        A rename, digit change or reactivation that would duplicate another
+        active method is rejected by the partial unique index at flush.
+        """
         logger.info(
             "Updating payment method",
             extra={"payment_method_id": str(payment_method.id)},
         )
 
-        incoming_name = (
-            payment_method_data.name
-            if payment_method_data.name is not None
-            else payment_method.name
-        )
-        incoming_digits = (
-            payment_method_data.last_4_digits
-            if "last_4_digits" in payment_method_data.model_fields_set
-            else payment_method.last_4_digits
-        )
-        name_changed = incoming_name != payment_method.name
-        digits_changed = incoming_digits != payment_method.last_4_digits
-
-        if name_changed or digits_changed:
-            existing_method = (
-                db.query(models.PaymentMethod)
-                .filter(
-                    and_(
-                        models.PaymentMethod.household_id
-                        == payment_method.household_id,
-                        models.PaymentMethod.name == incoming_name,
-                        models.PaymentMethod.last_4_digits == incoming_digits,
-                        models.PaymentMethod.active,
-                        models.PaymentMethod.id != payment_method.id,
-                    )
-                )
-                .first()
-            )
-
-            if existing_method:
-                raise PaymentMethodNameExistsExceptionError(incoming_name)
-
         try:
             update_data = payment_method_data.model_dump(exclude_unset=True)
             before = {field: getattr(payment_method, field) for field in update_data}
@@ -252,23 +229,46 @@ class PaymentMethodService:
     @staticmethod
     def delete_payment_method(
         db: Session,
-        payment_method: models.PaymentMethod,
+        payment_method_id: str,
+        household_id: uuid.UUID,
         actor: User,
     ) -> None:
-        """Soft delete a payment method (deactivate)."""
+        """Soft delete a payment method (deactivate).
+
+        Checks ownership and deactivates in a single ``UPDATE ... RETURNING``
+        instead of loading the row first.
+
+        Raises:
+            PaymentMethodNotFoundExceptionError: If the ID is malformed or no
+                payment method with it belongs to the household.
+        """
         logger.info(
             "Deactivating payment method",
-            extra={"payment_method_id": str(payment_method.id)},
+            extra={"payment_method_id": payment_method_id},
         )
 
-        payment_method.active = False
-        db.flush()
+        try:
+            pk = uuid.UUID(payment_method_id)
+        except ValueError as e:
+            raise PaymentMethodNotFoundExceptionError(payment_method_id) from e
+
+        deactivated_id = db.scalar(
+            update(models.PaymentMethod)
+            .where(
+                models.PaymentMethod.id == pk,
+                models.PaymentMethod.household_id == household_id,
+            )
+            .values(active=False)
+            .returning(models.PaymentMethod.id)
+        )
+        if deactivated_id is None:
+            raise PaymentMethodNotFoundExceptionError(payment_method_id)
 
         activity_service.record(
             db,
-            household_id=payment_method.household_id,
+            household_id=household_id,
             entity_type=EntityType.PAYMENT_METHOD,
-            entity_id=payment_method.id,
+            entity_id=deactivated_id,
             actor_user_id=actor.id,
             action=ActivityAction.DEACTIVATED,
         )
@@ -277,26 +277,24 @@ class PaymentMethodService:
 
         logger.info(
             "Payment method deactivated",
-            extra={"payment_method_id": str(payment_method.id)},
+            extra={"payment_method_id": payment_method_id},
         )
 
     @staticmethod
     def get_active_payment_methods_for_household(
         db: Session,
-        household_id: str,
+        household_id: uuid.UUID,
     ) -> list[models.PaymentMethod]:
         """Get all active payment methods for a household."""
-        return (
-            db.query(models.PaymentMethod)
-            .filter(
-                and_(
-                    models.PaymentMethod.household_id == household_id,
-                    models.PaymentMethod.active,
-                )
+        stmt = (
+            select(models.PaymentMethod)
+            .where(
+                models.PaymentMethod.household_id == household_id,
+                models.PaymentMethod.active,
             )
             .order_by(models.PaymentMethod.name)
-            .all()
         )
+        return list(db.scalars(stmt))
 
 
 payment_method_service = PaymentMethodService()
@@ -10,7 +10,7 @@ from . import service
 from .exceptions import RecurrentExpenseNotFoundExceptionError
 
 
-async def get_recurrent_expense_by_id(
+def get_recurrent_expense_by_id(
     recurrent_expense_id: str,
     current_household: CurrentActiveHousehold,
     db: Annotated[Session, Depends(get_db)],
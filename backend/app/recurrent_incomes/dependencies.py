@@ -10,7 +10,7 @@ from . import service
 from .exceptions import RecurrentIncomeNotFoundExceptionError
 
 
-async def get_recurrent_income_by_id(
+def get_recurrent_income_by_id(
     recurrent_income_id: str,
     current_household: CurrentActiveHousehold,
     db: Annotated[Session, Depends(get_db)],
@@ -1,15 +1,17 @@
+import app.activity.models
 import app.auth.models
 import app.cycles.models
+import app.households.models
 import app.payment_methods.models
 import app.recurrent_expenses.models
 import app.recurrent_incomes.models  # noqa: F401
-from app.database import Base, engine
+from app.database import create_missing_tables
 
 
 def create_tables() -> None:
     """Create all tables in the database."""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    create_missing_tables()
     print("✅ Tables created successfully!")
 
 
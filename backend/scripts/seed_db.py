@@ -16,7 +16,7 @@ from app.cycles import schemas as cycle_schemas, service as cycle_service_module
 # These imports ensure SQLAlchemy's mapper can resolve all relationships
 # before any query runs, and that create_all creates every table.
 from app.cycles.models import Cycle, CycleExpense, ExchangeRate  # noqa: F401
-from app.database import Base, SessionLocal, engine
+from app.database import SessionLocal, create_missing_tables
 from app.households.models import Household, UserHouseholdMembership
 from app.payment_methods.models import PaymentMethod
 from app.recurrent_expenses.models import RecurrentExpense
@@ -26,7 +26,7 @@ from app.recurrent_incomes.models import RecurrentIncome
 def create_tables() -> None:
     """Create all database tables if they do not already exist."""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    create_missing_tables()
     print("✅ Tables created successfully!")
 
 
@@ -223,3 +223,39 @@ class TestCommentsCrudEndpoint:
         assert response.status_code == 200
         bodies = [c["body"] for c in response.json()]
         assert sorted(bodies) == ["one", "two"]
+
+    def test_list_looks_up_authors_in_one_query(
+        self, client, test_payment_method, test_user, other_user, sql_statements
+    ):
+        author_headers = [
+            get_auth_headers(client, test_user),
+            get_auth_headers(client, other_user),
+        ]
+        for headers in author_headers * 2:
+            client.post(
+                "/api/v1/comments/",
+                headers=headers,
+                json={
+                    "entity_type": "payment_method",
+                    "entity_id": str(test_payment_method.id),
+                    "body": "hello",
+                },
+            )
+        sql_statements.clear()
+
+        response = client.get(
+            "/api/v1/comments/",
+            params={
+                "entity_type": "payment_method",
+                "entity_id": str(test_payment_method.id),
+            },
+            headers=author_headers[0],
+        )
+
+        assert response.status_code == 200
+        authors = [c["author"]["username"] for c in response.json()]
+        assert sorted(authors) == sorted([test_user.username, other_user.username] * 2)
+        author_lookups = [
+            s for s in sql_statements if s.startswith("SELECT users.id, users.username")
+        ]
+        assert len(author_lookups) == 1
@@ -115,7 +115,7 @@ class TestPaymentMethodActivity:
             last_4_digits=None,
         )
         pm = payment_method_service.create_payment_method(
-            db, data, str(test_household.id), actor=test_user
+            db, data, test_household.id, actor=test_user
         )
         events = activity_service.list_for_entity(
             db,
@@ -149,7 +149,7 @@ class TestPaymentMethodActivity:
         self, db, test_household, test_payment_method, test_user
     ):
         payment_method_service.delete_payment_method(
-            db, test_payment_method, actor=test_user
+            db, str(test_payment_method.id), test_household.id, actor=test_user
         )
         events = activity_service.list_for_entity(
             db,
@@ -0,0 +1,56 @@
+import uuid
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.auth.dependencies import clear_token_cache
+from app.auth.models import User
+from app.auth.service import clear_user_cache
+from app.auth.utils import create_access_token, get_password_hash
+
+RAW_PASSWORD = "testpassword123"
+
+
+@pytest.fixture(autouse=True)
+def _empty_auth_caches() -> Generator[None]:
+    clear_user_cache()
+    clear_token_cache()
+    yield
+    clear_user_cache()
+    clear_token_cache()
+
+
+@pytest.fixture
+def test_user(db: Session) -> User:
+    user = User(
+        username=f"auth_{uuid.uuid4().hex[:8]}",
+        password_hash=get_password_hash(RAW_PASSWORD),
+        first_name="Auth",
+        last_name="User",
+        preferred_currency="USD",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    token = create_access_token({"sub": test_user.username})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def admin_headers(db: Session) -> dict[str, str]:
+    admin = User(
+        username=f"admin_{uuid.uuid4().hex[:8]}",
+        password_hash=get_password_hash(RAW_PASSWORD),
+        preferred_currency="USD",
+        role="admin",
+    )
+    db.add(admin)
+    db.commit()
+    token = create_access_token({"sub": admin.username})
+    return {"Authorization": f"Bearer {token}"}
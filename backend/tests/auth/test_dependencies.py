@@ -0,0 +1,99 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.auth import dependencies, utils
+from app.auth.config import auth_settings
+from app.auth.dependencies import get_current_user
+from app.auth.exceptions import InvalidTokenExceptionError
+from app.database import get_db
+from app.main import app
+
+
+@pytest.fixture
+def verify_calls(monkeypatch):
+    calls: list[str] = []
+    real_verify = utils.verify_token
+
+    def _counting_verify(token):
+        calls.append(token)
+        return real_verify(token)
+
+    monkeypatch.setattr(utils, "verify_token", _counting_verify)
+    return calls
+
+
+class TestTokenCache:
+    def test_replayed_token_is_verified_once(self, db, test_user, verify_calls):
+        token = utils.create_access_token({"sub": test_user.username})
+
+        assert get_current_user(token, db).id == test_user.id
+        assert get_current_user(token, db).id == test_user.id
+        assert len(verify_calls) == 1
+
+    def test_cache_keys_are_digests_not_tokens(self, db, test_user):
+        token = utils.create_access_token({"sub": test_user.username})
+        get_current_user(token, db)
+
+        keys = list(dependencies._token_cache.keys())  # noqa: SLF001
+        assert len(keys) == 1
+        assert len(keys[0]) == 16
+        assert token.encode() not in keys
+
+    def test_invalid_token_is_never_cached(self, db, verify_calls):
+        for _ in range(2):
+            with pytest.raises(HTTPException, match="Could not validate credentials"):
+                get_current_user("not-a-jwt", db)
+        assert len(verify_calls) == 2
+
+    def test_expired_token_is_rejected(self, db, test_user):
+        token = utils.create_access_token(
+            {"sub": test_user.username}, expires_delta=timedelta(seconds=-1)
+        )
+        with pytest.raises(HTTPException, match="Could not validate credentials"):
+            get_current_user(token, db)
+
+    def test_extract_username_and_expiry(self, test_user):
+        token = utils.create_access_token({"sub": test_user.username})
+        username, expires_at = utils.extract_username_and_expiry(token)
+        assert username == test_user.username
+        assert expires_at > time.time()
+
+    def test_token_without_expiry_is_rejected(self, db, test_user, verify_calls):
+        token = jwt.encode(
+            {"sub": test_user.username},
+            auth_settings.SECRET_KEY,
+            algorithm=auth_settings.ALGORITHM,
+        )
+        for _ in range(2):
+            with pytest.raises(HTTPException, match="Could not validate credentials"):
+                get_current_user(token, db)
+        assert len(verify_calls) == 2
+
+    def test_extract_rejects_token_without_subject(self):
+        token = utils.create_access_token({})
+        with pytest.raises(InvalidTokenExceptionError):
+            utils.extract_username_and_expiry(token)
+
+
+class TestSessionPerRequest:
+    def test_dependency_tree_shares_one_session(self, client, db, test_user):
+        opened: list[object] = []
+
+        def counting_get_db():
+            opened.append(db)
+            yield db
+
+        token = utils.create_access_token({"sub": test_user.username})
+        app.dependency_overrides[get_db] = counting_get_db
+        response = client.put(
+            "/api/v1/auth/me",
+            json={"first_name": "Renamed"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        assert len(opened) == 1
@@ -0,0 +1,118 @@
+import time
+from collections.abc import Generator
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+from sqlalchemy import text
+
+from app.auth import invalidation, schemas, service
+from app.auth.constants import USER_CACHE_CHANNEL
+from app.auth.invalidation import UserCacheListener
+from app.auth.service import auth_service
+from tests.conftest import engine_test
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def listener() -> Generator[UserCacheListener]:
+    listener = UserCacheListener(engine_test)
+    listener.start()
+    yield listener
+    listener.stop()
+
+
+@pytest.fixture
+def channel() -> Generator[psycopg2.extensions.connection]:
+    """A dedicated driver connection subscribed to the user cache channel."""
+    cargs, cparams = engine_test.dialect.create_connect_args(engine_test.url)
+    conn = psycopg2.connect(*cargs, **cparams)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {USER_CACHE_CHANNEL}")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def cached_username(db, test_user, listener) -> str:
+    assert listener._listening.wait(timeout=5)  # noqa: SLF001
+    db.expunge_all()
+    auth_service.get_user_by_username(db, test_user.username)
+    return test_user.username
+
+
+def _is_cached(username: str) -> bool:
+    return username in service._user_cache  # noqa: SLF001
+
+
+class TestUserCacheListener:
+    def test_notification_evicts_user(self, cached_username):
+        assert _is_cached(cached_username)
+
+        with engine_test.connect() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :username)"),
+                {"channel": USER_CACHE_CHANNEL, "username": cached_username},
+            )
+            conn.commit()
+
+        assert _wait_until(lambda: not _is_cached(cached_username))
+
+    def test_user_update_is_announced(self, db, test_user, channel):
+        auth_service.update_user(db, test_user, schemas.UserUpdate(first_name="Moved"))
+
+        def _announced() -> bool:
+            channel.poll()
+            return any(n.payload == test_user.username for n in channel.notifies)
+
+        assert _wait_until(_announced)
+
+    def test_rolled_back_update_is_not_announced(self, db, test_user, channel):
+        test_user.first_name = "Discarded"
+        db.flush()
+        db.rollback()
+
+        time.sleep(0.2)
+        channel.poll()
+        assert channel.notifies == []
+
+    def test_stop_ends_the_thread(self, listener):
+        listener.stop()
+        assert listener._thread is None  # noqa: SLF001
+
+    def test_idle_connection_is_pinged(self, monkeypatch):
+        monkeypatch.setattr(invalidation, "KEEPALIVE_INTERVAL_SECONDS", 0.05)
+        listener = UserCacheListener(engine_test)
+        connections: list[psycopg2.extensions.connection] = []
+        connect = listener._connect  # noqa: SLF001
+
+        def _tracked_connect() -> psycopg2.extensions.connection:
+            connections.append(connect())
+            return connections[-1]
+
+        monkeypatch.setattr(listener, "_connect", _tracked_connect)
+        listener.start()
+        try:
+            assert listener._listening.wait(timeout=5)  # noqa: SLF001
+            pid = connections[0].get_backend_pid()
+
+            def _pinged() -> bool:
+                with engine_test.connect() as conn:
+                    query = conn.execute(
+                        text("SELECT query FROM pg_stat_activity WHERE pid = :pid"),
+                        {"pid": pid},
+                    ).scalar()
+                return query == "SELECT 1"
+
+            assert _wait_until(_pinged)
+        finally:
+            listener.stop()
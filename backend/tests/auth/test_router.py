@@ -0,0 +1,115 @@
+from app.auth import utils
+from tests.auth.conftest import RAW_PASSWORD
+
+
+class TestCurrentUser:
+    def test_get_me(self, client, test_user, auth_headers):
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["id"] == str(test_user.id)
+        assert body["username"] == test_user.username
+        assert body["preferred_currency"] == "USD"
+        assert "password_hash" not in body
+
+    def test_update_me(self, client, auth_headers):
+        response = client.put(
+            "/api/v1/auth/me",
+            json={"first_name": "Renamed", "locale": "es-MX"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["first_name"] == "Renamed"
+        assert response.json()["locale"] == "es-MX"
+
+    def test_get_me_requires_token(self, client):
+        response = client.get("/api/v1/auth/me")
+        assert response.status_code == 401
+
+
+class TestRegister:
+    def test_hashes_without_holding_a_transaction(
+        self, client, db, admin_headers, monkeypatch
+    ):
+        in_transaction: list[bool] = []
+        real_hash = utils.get_password_hash
+
+        def _recording_hash(password: str) -> str:
+            in_transaction.append(db.in_transaction())
+            return real_hash(password)
+
+        monkeypatch.setattr(utils, "get_password_hash", _recording_hash)
+        response = client.post(
+            "/api/v1/auth/register",
+            json={"username": "newcomer", "password": RAW_PASSWORD},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 201
+        assert in_transaction == [False]
+
+
+class TestCurrentUserEtag:
+    def test_get_me_sets_validators(self, client, auth_headers):
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_matching_etag_returns_not_modified(self, client, auth_headers):
+        etag = client.get("/api/v1/auth/me", headers=auth_headers).headers["ETag"]
+
+        response = client.get(
+            "/api/v1/auth/me", headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_wildcard_returns_not_modified(self, client, auth_headers):
+        response = client.get(
+            "/api/v1/auth/me", headers={**auth_headers, "If-None-Match": "*"}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_profile_update_changes_etag(self, client, auth_headers):
+        etag = client.get("/api/v1/auth/me", headers=auth_headers).headers["ETag"]
+        client.put("/api/v1/auth/me", json={"first_name": "New"}, headers=auth_headers)
+
+        response = client.get(
+            "/api/v1/auth/me", headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["first_name"] == "New"
+        assert response.headers["ETag"] != etag
+
+
+class TestAdminUserEtag:
+    def test_matching_etag_returns_not_modified(self, client, test_user, admin_headers):
+        url = f"/api/v1/auth/users/{test_user.id}"
+        first = client.get(url, headers=admin_headers)
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        response = client.get(
+            url, headers={**admin_headers, "If-None-Match": first.headers["ETag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_admin_update_changes_etag(self, client, test_user, admin_headers):
+        url = f"/api/v1/auth/users/{test_user.id}"
+        etag = client.get(url, headers=admin_headers).headers["ETag"]
+        client.put(url, json={"first_name": "Edited"}, headers=admin_headers)
+
+        response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["first_name"] == "Edited"
@@ -0,0 +1,22 @@
+import pytest
+from pydantic import ValidationError
+
+from app.auth.schemas import UserCreate, UserResponse
+
+
+class TestUserResponse:
+    def test_built_from_orm_user(self, test_user):
+        response = UserResponse.model_validate(test_user)
+        assert response.id == test_user.id
+        assert response.username == test_user.username
+        assert response.preferred_currency == "USD"
+
+    def test_does_not_reapply_input_constraints(self, test_user):
+        # Stored rows were validated on write; a username that predates the
+        # current length rule must still serialize.
+        test_user.username = "ab"
+        assert UserResponse.model_validate(test_user).username == "ab"
+
+    def test_create_still_enforces_username_length(self):
+        with pytest.raises(ValidationError):
+            UserCreate(username="ab", password="longenough123")  # noqa: S106
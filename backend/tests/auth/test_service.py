@@ -0,0 +1,233 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.auth import schemas, utils
+from app.auth.config import auth_settings
+from app.auth.constants import JWT_TOKEN_PREFIX
+from app.auth.exceptions import (
+    InvalidCredentialsExceptionError,
+    UserAlreadyExistsExceptionError,
+)
+from app.auth.service import auth_service
+from tests.auth.conftest import RAW_PASSWORD
+from tests.conftest import TestingSessionLocal
+
+
+class TestCreateUser:
+    def test_creates_user_with_a_single_insert(self, db, sql_statements):
+        user = auth_service.create_user(
+            db,
+            schemas.UserCreate(username="newcomer", password=RAW_PASSWORD),
+        )
+
+        assert user.username == "newcomer"
+        assert utils.verify_password(RAW_PASSWORD, user.password_hash)
+        # No existence check: the first statement is the insert itself.
+        assert sql_statements[0].lstrip().startswith("INSERT INTO users")
+
+    def test_duplicate_username_is_rejected(self, db, test_user):
+        duplicate = schemas.UserCreate(username=test_user.username, password="x" * 8)
+
+        with pytest.raises(UserAlreadyExistsExceptionError):
+            auth_service.create_user(db, duplicate)
+
+        # The session stays usable after the conflict.
+        other = schemas.UserCreate(username="another", password="x" * 8)
+        assert auth_service.create_user(db, other).username == "another"
+
+
+class TestAuthenticateUser:
+    def test_valid_credentials(self, db, test_user):
+        user = auth_service.authenticate_user(db, test_user.username, RAW_PASSWORD)
+        assert user.id == test_user.id
+
+    def test_lookup_statement_is_reused_across_usernames(
+        self, db, test_user, sql_statements
+    ):
+        auth_service.authenticate_user(db, test_user.username, RAW_PASSWORD)
+        with pytest.raises(InvalidCredentialsExceptionError):
+            auth_service.authenticate_user(db, "nobody", RAW_PASSWORD)
+
+        lookups = [s for s in sql_statements if "password_hash" in s]
+        assert len(lookups) == 2
+        assert lookups[0] == lookups[1]
+
+    def test_failed_login_selects_only_credentials(self, db, test_user, sql_statements):
+        with pytest.raises(InvalidCredentialsExceptionError):
+            auth_service.authenticate_user(db, test_user.username, "wrong-password")
+
+        (lookup,) = sql_statements
+        select_list = lookup.split("FROM")[0]
+        assert "password_hash" in select_list
+        assert "first_name" not in select_list
+
+    def test_wrong_password_is_rejected(self, db, test_user):
+        with pytest.raises(InvalidCredentialsExceptionError):
+            auth_service.authenticate_user(db, test_user.username, "wrong-password")
+
+    def test_unknown_user_still_pays_for_a_verify(self, db, monkeypatch):
+        verified: list[str] = []
+        real_verify = utils.verify_password
+
+        def _recording_verify(password: str, hashed: str) -> bool:
+            verified.append(hashed)
+            return real_verify(password, hashed)
+
+        monkeypatch.setattr(utils, "verify_password", _recording_verify)
+
+        with pytest.raises(InvalidCredentialsExceptionError):
+            auth_service.authenticate_user(db, "nobody", RAW_PASSWORD)
+        assert len(verified) == 1
+        assert verified[0].startswith("$argon2id$")
+
+    def test_current_hash_is_left_alone(self, db, test_user):
+        stored = test_user.password_hash
+        auth_service.authenticate_user(db, test_user.username, RAW_PASSWORD)
+        assert test_user.password_hash == stored
+
+    def test_stale_hash_is_upgraded_on_login(self, db, test_user):
+        legacy = PasswordHash((Argon2Hasher(time_cost=2, memory_cost=8 * 1024),))
+        test_user.password_hash = legacy.hash(RAW_PASSWORD)
+        db.commit()
+
+        user = auth_service.authenticate_user(db, test_user.username, RAW_PASSWORD)
+
+        db.refresh(user)
+        expected_params = (
+            f"m={auth_settings.ARGON2_MEMORY_COST},"
+            f"t={auth_settings.ARGON2_TIME_COST},"
+            f"p={auth_settings.ARGON2_PARALLELISM}$"
+        )
+        assert expected_params in user.password_hash
+        assert utils.verify_password(RAW_PASSWORD, user.password_hash)
+
+
+class TestUserCache:
+    def test_repeat_lookup_skips_the_database(self, db, test_user, sql_statements):
+        first = auth_service.get_user_by_username(db, test_user.username)
+        assert first is test_user
+        assert len(sql_statements) == 1
+
+        second = auth_service.get_user_by_username(db, test_user.username)
+        assert second is test_user
+        assert len(sql_statements) == 1
+
+    def test_cached_user_attaches_to_a_new_session(self, db, test_user):
+        auth_service.get_user_by_username(db, test_user.username)
+        db.expunge_all()
+
+        user = auth_service.get_user_by_username(db, test_user.username)
+        assert user is not None
+        assert user is not test_user
+        assert user in db
+        assert user.id == test_user.id
+        assert user.first_name == "Auth"
+
+    def test_update_evicts_cached_user(self, db, test_user):
+        auth_service.get_user_by_username(db, test_user.username)
+        auth_service.update_user(db, test_user, schemas.UserUpdate(first_name="New"))
+        db.expunge_all()
+
+        user = auth_service.get_user_by_username(db, test_user.username)
+        assert user is not None
+        assert user.first_name == "New"
+
+    def test_deactivated_user_is_not_served_from_cache(self, db, test_user):
+        auth_service.get_user_by_username(db, test_user.username)
+        test_user.active = False
+        db.commit()
+
+        assert auth_service.get_user_by_username(db, test_user.username) is None
+
+    def test_concurrent_misses_share_one_query(self, test_user, sql_statements):
+        username = test_user.username
+        workers = 8
+        start = threading.Barrier(workers)
+
+        def lookup() -> str | None:
+            with TestingSessionLocal() as session:
+                start.wait()
+                user = auth_service.get_user_by_username(session, username)
+                return None if user is None else user.username
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda _: lookup(), range(workers)))
+
+        assert results == [username] * workers
+        user_selects = [s for s in sql_statements if s.startswith("SELECT users.")]
+        assert len(user_selects) == 1
+
+
+class TestActiveUserLookups:
+    def test_get_user_by_id_returns_active_user(self, db, test_user):
+        assert auth_service.get_user_by_id(db, test_user.id) is test_user
+
+    def test_get_user_by_id_uses_the_identity_map(self, db, test_user, sql_statements):
+        assert auth_service.get_user_by_id(db, test_user.id) is test_user
+        assert sql_statements == []
+
+    def test_get_user_by_id_ignores_inactive_user(self, db, test_user):
+        test_user.active = False
+        db.commit()
+        assert auth_service.get_user_by_id(db, test_user.id) is None
+
+    def test_get_user_by_username_ignores_unknown_user(self, db):
+        assert auth_service.get_user_by_username(db, "nobody") is None
+
+    def test_get_user_by_username_defers_password_hash(
+        self, db, test_user, sql_statements
+    ):
+        db.expunge_all()
+        auth_service.get_user_by_username(db, test_user.username)
+
+        assert len(sql_statements) == 1
+        assert "password_hash" not in sql_statements[0]
+
+    def test_deferred_password_hash_loads_for_password_change(self, db, test_user):
+        db.expunge_all()
+        auth_service.get_user_by_username(db, test_user.username)
+        db.expunge_all()
+        user = auth_service.get_user_by_username(db, test_user.username)
+        assert user is not None
+
+        update = schemas.UserUpdatePassword(
+            current_password=RAW_PASSWORD,
+            new_password="anotherpassword456",  # noqa: S106
+        )
+        auth_service.update_password(db, user, update)
+
+        assert utils.verify_password("anotherpassword456", user.password_hash)
+
+
+class TestUpdateUser:
+    def test_only_sent_fields_change(self, db, test_user):
+        original_last_name = test_user.last_name
+        update = schemas.UserUpdate(first_name="Renamed")
+
+        user = auth_service.update_user(db, test_user, update)
+
+        assert user.first_name == "Renamed"
+        assert user.last_name == original_last_name
+
+    def test_empty_update_skips_the_database(self, db, test_user, sql_statements):
+        user = auth_service.update_user(db, test_user, schemas.UserUpdate())
+
+        assert user is test_user
+        assert sql_statements == []
+
+
+class TestAccessToken:
+    def test_expiry_matches_settings(self, test_user):
+        token = auth_service.create_access_token(test_user)
+        payload = utils.verify_token(token.access_token)
+
+        expected = auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        assert token.expires_in == expected
+        assert token.token_type == JWT_TOKEN_PREFIX
+        assert payload["sub"] == test_user.username
+        assert payload["exp"] - payload["iat"] == expected
+        assert payload["type"] == "access"
@@ -0,0 +1,45 @@
+import threading
+
+from app.auth import utils
+
+
+class TestPasswordHashing:
+    def test_hash_round_trip(self):
+        hashed = utils.get_password_hash("correct horse")
+        assert hashed.startswith("$argon2id$v=19$m=47104,t=1,p=1$")
+        assert utils.verify_password("correct horse", hashed)
+        assert not utils.verify_password("wrong horse", hashed)
+
+    def test_unrecognized_hash_does_not_verify(self):
+        assert not utils.verify_password("anything", "not-an-argon2-hash")
+
+    def test_current_hash_needs_no_update(self):
+        hashed = utils.get_password_hash("correct horse")
+        assert utils.verify_and_update_password("correct horse", hashed) == (
+            True,
+            None,
+        )
+
+    def test_mismatch_is_never_rehashed(self):
+        hashed = utils.get_password_hash("correct horse")
+        assert utils.verify_and_update_password("wrong horse", hashed) == (
+            False,
+            None,
+        )
+
+    def test_hashing_waits_for_a_free_slot(self, monkeypatch):
+        slots = threading.BoundedSemaphore(1)
+        monkeypatch.setattr(utils, "_hash_slots", slots)
+        hashed: list[str] = []
+        worker = threading.Thread(
+            target=lambda: hashed.append(utils.get_password_hash("correct horse"))
+        )
+
+        with slots:
+            worker.start()
+            worker.join(timeout=0.2)
+            assert worker.is_alive()
+            assert not hashed
+
+        worker.join()
+        assert utils.verify_password("correct horse", hashed[0])
@@ -3,7 +3,7 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.database import Base, get_db
@@ -39,3 +39,16 @@ def client(db: Session) -> Generator[TestClient]:
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def sql_statements() -> Generator[list[str]]:
+    """Collect every SQL statement executed against the test engine."""
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, _params, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(engine_test, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine_test, "before_cursor_execute", _record)
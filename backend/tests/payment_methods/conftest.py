@@ -0,0 +1,60 @@
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.auth.models import User
+from app.auth.utils import get_password_hash
+from app.households.models import Household, UserHouseholdMembership
+from app.payment_methods.constants import CurrencyCode, PaymentMethodType
+from app.payment_methods.models import PaymentMethod
+
+
+@pytest.fixture
+def test_household(db: Session) -> Household:
+    household = Household(name=f"Test Household {uuid.uuid4().hex[:8]}")
+    db.add(household)
+    db.commit()
+    db.refresh(household)
+    return household
+
+
+@pytest.fixture
+def other_household(db: Session) -> Household:
+    household = Household(name=f"Other Household {uuid.uuid4().hex[:8]}")
+    db.add(household)
+    db.commit()
+    db.refresh(household)
+    return household
+
+
+@pytest.fixture
+def test_user(db: Session, test_household: Household) -> User:
+    user = User(
+        username=f"test_{uuid.uuid4().hex[:8]}",
+        password_hash=get_password_hash("testpassword123"),
+        first_name="Test",
+        last_name="User",
+        preferred_currency="USD",
+        active_household_id=test_household.id,
+    )
+    db.add(user)
+    db.flush()
+    db.add(UserHouseholdMembership(user_id=user.id, household_id=test_household.id))
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def test_payment_method(db: Session, test_household: Household) -> PaymentMethod:
+    pm = PaymentMethod(
+        household_id=test_household.id,
+        name="Chase Debit",
+        method_type=PaymentMethodType.DEBIT,
+        default_currency=CurrencyCode.USD,
+    )
+    db.add(pm)
+    db.commit()
+    db.refresh(pm)
+    return pm
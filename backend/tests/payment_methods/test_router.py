@@ -0,0 +1,122 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.auth.models import User
+from app.payment_methods.constants import (
+    MAX_PAYMENT_METHODS_PER_USER,
+    CurrencyCode,
+    PaymentMethodType,
+)
+from app.payment_methods.models import PaymentMethod
+
+
+def get_auth_headers(client: TestClient, user: User) -> dict[str, str]:
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": user.username, "password": "testpassword123"},
+    )
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestGetPaymentMethods:
+    def test_list_returns_household_payment_methods(
+        self, client, test_user, test_payment_method
+    ):
+        headers = get_auth_headers(client, test_user)
+        response = client.get("/api/v1/payment-methods/", headers=headers)
+
+        assert response.status_code == 200
+        (body,) = response.json()
+        assert body["id"] == str(test_payment_method.id)
+        assert body["name"] == "Chase Debit"
+        assert body["method_type"] == "debit"
+        assert body["default_currency"] == "USD"
+        assert body["active"] is True
+
+
+class TestGetPaymentMethod:
+    def test_get_by_id(self, client, test_user, test_payment_method):
+        headers = get_auth_headers(client, test_user)
+        response = client.get(
+            f"/api/v1/payment-methods/{test_payment_method.id}", headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == str(test_payment_method.id)
+
+    def test_unknown_id_returns_404(self, client, test_user):
+        headers = get_auth_headers(client, test_user)
+        response = client.get(
+            f"/api/v1/payment-methods/{uuid.uuid4()}", headers=headers
+        )
+        assert response.status_code == 404
+
+    def test_malformed_id_returns_404(self, client, test_user):
+        headers = get_auth_headers(client, test_user)
+        response = client.get("/api/v1/payment-methods/not-a-uuid", headers=headers)
+        assert response.status_code == 404
+
+
+class TestDeletePaymentMethod:
+    def test_delete_deactivates(self, client, test_user, test_payment_method):
+        headers = get_auth_headers(client, test_user)
+        url = f"/api/v1/payment-methods/{test_payment_method.id}"
+
+        response = client.delete(url, headers=headers)
+        assert response.status_code == 204
+
+        response = client.get(url, headers=headers)
+        assert response.json()["active"] is False
+
+    def test_unknown_id_returns_404(self, client, test_user):
+        headers = get_auth_headers(client, test_user)
+        response = client.delete(
+            f"/api/v1/payment-methods/{uuid.uuid4()}", headers=headers
+        )
+        assert response.status_code == 404
+
+
+class TestCurrencyFilter:
+    def test_filters_by_currency(self, client, test_user, test_payment_method):
+        headers = get_auth_headers(client, test_user)
+
+        usd = client.get("/api/v1/payment-methods/?currency=USD", headers=headers)
+        mxn = client.get("/api/v1/payment-methods/?currency=MXN", headers=headers)
+
+        assert [pm["id"] for pm in usd.json()] == [str(test_payment_method.id)]
+        assert mxn.json() == []
+
+    def test_unknown_currency_is_rejected_before_the_query(self, client, test_user):
+        headers = get_auth_headers(client, test_user)
+        response = client.get("/api/v1/payment-methods/?currency=XYZ", headers=headers)
+        assert response.status_code == 422
+
+
+class TestQueryCount:
+    def test_list_query_count_does_not_grow_with_rows(
+        self, client, db, test_user, test_household, sql_statements
+    ):
+        headers = get_auth_headers(client, test_user)
+        db.add_all(
+            PaymentMethod(
+                household_id=test_household.id,
+                name=f"Card {i}",
+                method_type=PaymentMethodType.CREDIT,
+                default_currency=CurrencyCode.USD,
+            )
+            for i in range(MAX_PAYMENT_METHODS_PER_USER)
+        )
+        db.commit()
+        db.expire_all()
+        sql_statements.clear()
+
+        response = client.get("/api/v1/payment-methods/", headers=headers)
+
+        assert response.status_code == 200
+        assert len(response.json()) == MAX_PAYMENT_METHODS_PER_USER
+        selects = [s for s in sql_statements if s.lstrip().startswith("SELECT")]
+        assert len([s for s in selects if "FROM payment_methods" in s]) == 1
+        assert len(selects) <= 3
@@ -0,0 +1,55 @@
+import pytest
+from pydantic import ValidationError
+
+from app.payment_methods.schemas import PaymentMethodCreate, PaymentMethodUpdate
+
+BASE_VALID = {
+    "name": "Visa",
+    "method_type": "credit",
+    "default_currency": "USD",
+}
+
+
+class TestLastFourDigits:
+    def test_valid_digits_are_stripped(self):
+        schema = PaymentMethodCreate.model_validate(
+            {**BASE_VALID, "last_4_digits": " 1234 "}
+        )
+        assert schema.last_4_digits == "1234"
+
+    def test_blank_becomes_none(self):
+        schema = PaymentMethodCreate.model_validate(
+            {**BASE_VALID, "last_4_digits": "  "}
+        )
+        assert schema.last_4_digits is None
+
+    @pytest.mark.parametrize("value", ["123", "12345", "12a4"])
+    def test_rejects_anything_but_four_digits(self, value):
+        with pytest.raises(ValidationError, match="exactly 4 digits"):
+            PaymentMethodCreate.model_validate({**BASE_VALID, "last_4_digits": value})
+
+    def test_update_uses_the_same_rule(self):
+        schema = PaymentMethodUpdate.model_validate({"last_4_digits": "0042"})
+        assert schema.last_4_digits == "0042"
+        with pytest.raises(ValidationError, match="exactly 4 digits"):
+            PaymentMethodUpdate.model_validate({"last_4_digits": "42"})
+
+
+class TestWhitespace:
+    def test_name_and_description_are_stripped(self):
+        schema = PaymentMethodCreate.model_validate(
+            {**BASE_VALID, "name": "  Visa  ", "description": "  Travel card "}
+        )
+        assert schema.name == "Visa"
+        assert schema.description == "Travel card"
+
+    def test_blank_description_becomes_none(self):
+        schema = PaymentMethodCreate.model_validate(
+            {**BASE_VALID, "description": "   "}
+        )
+        assert schema.description is None
+
+    @pytest.mark.parametrize("schema", [PaymentMethodCreate, PaymentMethodUpdate])
+    def test_blank_name_is_rejected(self, schema):
+        with pytest.raises(ValidationError, match="at least 1 character"):
+            schema.model_validate({**BASE_VALID, "name": "   "})
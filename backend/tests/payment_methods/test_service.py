@@ -0,0 +1,219 @@
+import uuid
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.payment_methods.constants import (
+    MAX_PAYMENT_METHODS_PER_USER,
+    CurrencyCode,
+    PaymentMethodType,
+)
+from app.payment_methods.exceptions import (
+    PaymentMethodInUseExceptionError,
+    PaymentMethodNameExistsExceptionError,
+    PaymentMethodNotFoundExceptionError,
+)
+from app.payment_methods.models import PaymentMethod
+from app.payment_methods.schemas import PaymentMethodCreate, PaymentMethodUpdate
+from app.payment_methods.service import payment_method_service
+
+
+class TestGetPaymentMethodById:
+    def test_returns_household_payment_method(
+        self, db, test_household, test_payment_method
+    ):
+        found = payment_method_service.get_payment_method_by_id(
+            db, str(test_payment_method.id), test_household.id
+        )
+        assert found is test_payment_method
+
+    def test_other_household_gets_none(self, db, other_household, test_payment_method):
+        found = payment_method_service.get_payment_method_by_id(
+            db, str(test_payment_method.id), other_household.id
+        )
+        assert found is None
+
+    def test_unknown_id_gets_none(self, db, test_household):
+        found = payment_method_service.get_payment_method_by_id(
+            db, str(uuid.uuid4()), test_household.id
+        )
+        assert found is None
+
+    def test_malformed_id_skips_the_database(self, db, test_household, sql_statements):
+        found = payment_method_service.get_payment_method_by_id(
+            db, "not-a-uuid", test_household.id
+        )
+        assert found is None
+        assert sql_statements == []
+
+    def test_loaded_payment_method_skips_the_database(
+        self, db, test_payment_method, sql_statements
+    ):
+        payment_method_service.get_payment_method_by_id(
+            db, str(test_payment_method.id), test_payment_method.household_id
+        )
+        assert sql_statements == []
+
+
+class TestGetPaymentMethods:
+    def test_returns_household_payment_methods(
+        self, db, test_household, test_payment_method
+    ):
+        found = payment_method_service.get_payment_methods(db, test_household.id)
+        assert [pm.id for pm in found] == [test_payment_method.id]
+
+    def test_relationships_are_not_lazy_loaded(
+        self, db, test_household, test_payment_method
+    ):
+        household_id = test_household.id
+        db.expunge_all()
+
+        (payment_method,) = payment_method_service.get_payment_methods(db, household_id)
+
+        with pytest.raises(InvalidRequestError):
+            _ = payment_method.household
+
+
+class TestCreatePaymentMethod:
+    def test_household_at_the_cap_is_rejected(self, db, test_household, test_user):
+        db.add_all(
+            PaymentMethod(
+                household_id=test_household.id,
+                name=f"Card {i}",
+                method_type=PaymentMethodType.CREDIT,
+                default_currency=CurrencyCode.USD,
+            )
+            for i in range(MAX_PAYMENT_METHODS_PER_USER)
+        )
+        db.commit()
+        data = PaymentMethodCreate.model_validate(
+            {"name": "One Too Many", "method_type": "cash", "default_currency": "USD"}
+        )
+
+        with pytest.raises(PaymentMethodInUseExceptionError):
+            payment_method_service.create_payment_method(
+                db, data, test_household.id, actor=test_user
+            )
+
+    def test_duplicate_active_method_is_rejected(
+        self, db, test_household, test_user, test_payment_method
+    ):
+        data = PaymentMethodCreate.model_validate(
+            {"name": "Chase Debit", "method_type": "debit", "default_currency": "USD"}
+        )
+
+        with pytest.raises(PaymentMethodNameExistsExceptionError):
+            payment_method_service.create_payment_method(
+                db, data, test_household.id, actor=test_user
+            )
+
+    def test_same_name_with_other_digits_is_allowed(
+        self, db, test_household, test_user, test_payment_method
+    ):
+        data = PaymentMethodCreate.model_validate(
+            {
+                "name": "Chase Debit",
+                "method_type": "debit",
+                "default_currency": "USD",
+                "last_4_digits": "1234",
+            }
+        )
+
+        created = payment_method_service.create_payment_method(
+            db, data, test_household.id, actor=test_user
+        )
+        assert created.last_4_digits == "1234"
+
+    def test_name_of_a_deactivated_method_can_be_reused(
+        self, db, test_household, test_user, test_payment_method
+    ):
+        payment_method_service.delete_payment_method(
+            db, str(test_payment_method.id), test_household.id, actor=test_user
+        )
+        data = PaymentMethodCreate.model_validate(
+            {"name": "Chase Debit", "method_type": "debit", "default_currency": "USD"}
+        )
+
+        created = payment_method_service.create_payment_method(
+            db, data, test_household.id, actor=test_user
+        )
+        assert created.active
+
+
+class TestUpdatePaymentMethod:
+    def test_renaming_onto_an_active_method_is_rejected(
+        self, db, test_household, test_user, test_payment_method
+    ):
+        other = PaymentMethod(
+            household_id=test_household.id,
+            name="Amex",
+            method_type=PaymentMethodType.CREDIT,
+            default_currency=CurrencyCode.USD,
+        )
+        db.add(other)
+        db.commit()
+
+        with pytest.raises(PaymentMethodNameExistsExceptionError):
+            payment_method_service.update_payment_method(
+                db,
+                other,
+                PaymentMethodUpdate.model_validate({"name": "Chase Debit"}),
+                actor=test_user,
+            )
+
+    def test_reactivating_a_duplicate_is_rejected(
+        self, db, test_household, test_user, test_payment_method
+    ):
+        duplicate = PaymentMethod(
+            household_id=test_household.id,
+            name="Chase Debit",
+            method_type=PaymentMethodType.DEBIT,
+            default_currency=CurrencyCode.USD,
+            active=False,
+        )
+        db.add(duplicate)
+        db.commit()
+
+        with pytest.raises(PaymentMethodNameExistsExceptionError):
+            payment_method_service.update_payment_method(
+                db,
+                duplicate,
+                PaymentMethodUpdate.model_validate({"active": True}),
+                actor=test_user,
+            )
+
+
+class TestDeletePaymentMethod:
+    def test_deactivates_with_a_single_update(
+        self, db, test_user, test_payment_method, sql_statements
+    ):
+        payment_method_service.delete_payment_method(
+            db,
+            str(test_payment_method.id),
+            test_payment_method.household_id,
+            actor=test_user,
+        )
+
+        assert sql_statements[0].lstrip().startswith("UPDATE payment_methods")
+        assert not any(
+            s.lstrip().startswith("SELECT") and "FROM payment_methods" in s
+            for s in sql_statements
+        )
+        db.refresh(test_payment_method)
+        assert not test_payment_method.active
+
+    def test_other_household_gets_not_found(
+        self, db, other_household, test_user, test_payment_method
+    ):
+        with pytest.raises(PaymentMethodNotFoundExceptionError):
+            payment_method_service.delete_payment_method(
+                db, str(test_payment_method.id), other_household.id, actor=test_user
+            )
+        db.refresh(test_payment_method)
+        assert test_payment_method.active
+
+    def test_malformed_id_gets_not_found(self, db, test_household, test_user):
+        with pytest.raises(PaymentMethodNotFoundExceptionError):
+            payment_method_service.delete_payment_method(
+                db, "not-a-uuid", test_household.id, actor=test_user
+            )